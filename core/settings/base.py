@@ -154,6 +154,11 @@ PASSWORD_RESET_TIMEOUT_SECONDS = 259200  # 3 days (default for production)
 
 # Cache and timeout settings
 DEFAULT_CACHE_TIMEOUT_SECONDS = 3600  # 1 hour
+# In-process cache of the SiteSettings row, off by default. When enabled,
+# admin changes (e.g. turning off audio_generation_enabled) reach other web
+# and Celery processes only once their copy expires, up to this many seconds
+# later; the process that saved the row sees the change immediately.
+SITE_SETTINGS_CACHE_SECONDS = config("SITE_SETTINGS_CACHE_SECONDS", default=0, cast=int)
 DATABASE_POOL_MAX_CONNECTIONS = 50  # Max database connections in pool
 SOCKET_TIMEOUT_SECONDS = 5  # Socket timeout for network operations
 
@@ -0,0 +1,56 @@
+from .base import *
+from decouple import config
+
+# Settings for running the test suite:
+#   python manage.py test --settings=core.settings.test
+#
+# Or for a single module:
+#   python manage.py test speech_processing.tests.test_api_endpoints --settings=core.settings.test
+#
+# The TestCase classes share no mutable state, so they can also run across
+# worker processes (each worker gets its own cloned database):
+#   python manage.py test --settings=core.settings.test --parallel=auto
+# Without a value, --parallel reads the worker count from the
+# DJANGO_TEST_PROCESSES environment variable (defaulting to one per core):
+#   DJANGO_TEST_PROCESSES=4 python manage.py test --settings=core.settings.test --parallel
+# When pointing DATABASES at Postgres instead, add --keepdb to skip
+# re-running migrations between runs (it has no effect for :memory:).
+#
+# Quick model-level checks are tagged so CI can run them on their own:
+#   python manage.py test --settings=core.settings.test --tag=fast
+
+DEBUG = False
+
+ALLOWED_HOSTS = ["localhost", "127.0.0.1", "testserver"]
+
+# In-memory SQLite test database.
+# TestCase wraps every test in a transaction that is rolled back, so
+# durability is irrelevant here and skipping the disk flush on every
+# commit/savepoint makes the DB-bound tests considerably faster.
+# The test database is rebuilt from scratch on every run.
+#
+# For CI runs against PostgreSQL instead, start the container with
+# durability disabled for the same effect:
+#   postgres -c fsync=off -c synchronous_commit=off -c full_page_writes=off
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+        "TEST": {"NAME": ":memory:"},
+    }
+}
+
+# Tests log in with force_login and never check passwords, so skip the
+# slow default hasher when fixtures set one
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+# Emails are captured in django.core.mail.outbox during tests
+EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+DEFAULT_FROM_EMAIL = "webmaster@localhost"
+
+# === CLOUDFRONT CONFIGURATION (for testing) ===
+# Tests mock the signing calls, so empty credentials are fine here
+CLOUDFRONT_DOMAIN = config("CLOUDFRONT_DOMAIN", default="d2e40gg2o2wus6.cloudfront.net")
+CLOUDFRONT_KEY_ID = config("CLOUDFRONT_KEY_ID", default="")
+CLOUDFRONT_PRIVATE_KEY = config("CLOUDFRONT_PRIVATE_KEY", default="")
+CLOUDFRONT_EXPIRATION = 3600  # 1 hour
@@ -18,18 +18,21 @@ User = get_user_model()
 class TaskFailureAlertAdminTests(TestCase):
     """Tests for the TaskFailureAlert admin functionality."""
 
-    def setUp(self):
-        self.client = Client()
-        self.admin_user = User.objects.create_superuser(
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = User.objects.create_superuser(
             username="admin", email="admin@example.com", password="pass"
         )
-        self.client.force_login(self.admin_user)
 
         # Create regular user for documents
-        self.regular_user = User.objects.create_user(
+        cls.regular_user = User.objects.create_user(
             username="user", email="user@example.com", password="pass"
         )
 
+    def setUp(self):
+        self.client = Client()
+        self.client.force_login(self.admin_user)
+
         # Create admin site and admin instance
         self.site = AdminSite()
         self.task_admin = TaskFailureAlertAdmin(TaskFailureAlert, self.site)
@@ -12,8 +12,9 @@ User = get_user_model()
 class ParseDocumentTaskSuccessTests(TestCase):
     """Tests for the 'happy path' where everything works correctly."""
 
-    def setUp(self):
-        self.user = User.objects.create_user(username="tasker", password="p")
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="tasker", password="p")
 
     def test_text_source_creates_one_page(self):
         # Arrange
@@ -56,8 +57,9 @@ class ParseDocumentTaskSuccessTests(TestCase):
 class ParseDocumentTaskFailureTests(TestCase):
     """Tests for the 'unhappy path' to ensure robust error handling."""
 
-    def setUp(self):
-        self.user = User.objects.create_user(username="fail_tester", password="p")
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="fail_tester", password="p")
 
     @patch("document_processing.tasks.requests.get")
     def test_task_fails_gracefully_on_bad_url(self, mock_get):
@@ -1,9 +1,15 @@
 from django.db import models
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.core.signals import setting_changed
 from django.utils import timezone
 from datetime import timedelta
+import copy
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -108,6 +114,16 @@ class Audio(models.Model):
                 name="unique_voice_per_page",
             )
         ]
+        indexes = [
+            # check_expired_audios only ever scans active audios, comparing
+            # COALESCE(last_played_at, created_at) with the cutoff; indexing
+            # that same expression lets the range condition use the index
+            models.Index(
+                Coalesce("last_played_at", "created_at"),
+                condition=models.Q(lifetime_status=AudioLifetimeStatus.ACTIVE),
+                name="audio_active_expiry_idx",
+            ),
+        ]
 
     def clean(self):
         """Validate business rules."""
@@ -149,11 +165,17 @@ class Audio(models.Model):
     def __str__(self):
         return f"{self.voice} audio for {self.page} by {self.generated_by.email}"
 
-    def is_expired(self):
-        """Check if audio should be expired (not played for 6 months)."""
+    def is_expired(self, settings_obj=None):
+        """
+        Check if audio should be expired (not played for 6 months).
+
+        Callers checking many audios can pass the SiteSettings they already
+        loaded to avoid one settings query per audio.
+        """
         from speech_processing.models import SiteSettings
 
-        settings_obj = SiteSettings.get_settings()
+        if settings_obj is None:
+            settings_obj = SiteSettings.get_settings()
         retention_days = settings_obj.audio_retention_months * 30
 
         reference_date = self.last_played_at or self.created_at
@@ -172,11 +194,12 @@ class Audio(models.Model):
 
         return is_exp
 
-    def days_until_expiry(self):
+    def days_until_expiry(self, settings_obj=None):
         """Calculate days until expiry."""
         from speech_processing.models import SiteSettings
 
-        settings_obj = SiteSettings.get_settings()
+        if settings_obj is None:
+            settings_obj = SiteSettings.get_settings()
         retention_days = settings_obj.audio_retention_months * 30
 
         reference_date = self.last_played_at or self.created_at
@@ -184,9 +207,9 @@ class Audio(models.Model):
         days_left = (expiry_date - timezone.now()).days
         return max(0, days_left)
 
-    def needs_expiry_warning(self):
+    def needs_expiry_warning(self, settings_obj=None):
         """Check if audio needs expiry warning (30 days before expiry)."""
-        days_left = self.days_until_expiry()
+        days_left = self.days_until_expiry(settings_obj)
         return 0 < days_left <= 30
 
     def get_expiry_date(self):
@@ -306,6 +329,7 @@ class AudioAccessLog(models.Model):
         ordering = ["-timestamp"]
         indexes = [
             models.Index(fields=["-timestamp"]),
+            models.Index(fields=["user", "-timestamp"]),
             models.Index(fields=["action", "-timestamp"]),
         ]
 
@@ -348,6 +372,9 @@ class SiteSettings(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # (instance, time.monotonic() when loaded) for this process; see get_settings
+    _cached = None
+
     class Meta:
         verbose_name_plural = "Site Settings"
 
@@ -362,7 +389,24 @@ class SiteSettings(models.Model):
 
     @classmethod
     def get_settings(cls):
-        """Get the site settings instance, creating if it doesn't exist."""
+        """
+        Get the site settings instance, creating if it doesn't exist.
+
+        Uses get_or_create on a fixed pk so concurrent callers (e.g. parallel
+        test workers or Celery workers) converge on the same row instead of
+        racing to insert a second instance.
+
+        If SITE_SETTINGS_CACHE_SECONDS is set, the row is kept in memory for
+        that long. Saving or deleting it clears this process's copy straight
+        away; other web and Celery processes pick the change up only once
+        their copy expires. Each caller gets its own copy, so mutating the
+        result never leaks into the cache.
+        """
+        ttl = settings.SITE_SETTINGS_CACHE_SECONDS
+        cached = cls._cached
+        if cached is not None and time.monotonic() - cached[1] < ttl:
+            return copy.copy(cached[0])
+
         settings_obj, created = cls.objects.get_or_create(
             pk=1,
             defaults={
@@ -375,8 +419,34 @@ class SiteSettings(models.Model):
                 "auto_delete_expired_enabled": True,
             },
         )
+        if ttl > 0:
+            cls._cached = (copy.copy(settings_obj), time.monotonic())
         return settings_obj
 
+    @classmethod
+    def clear_cache(cls):
+        """Drop this process's cached copy of the settings row."""
+        cls._cached = None
+
+
+@receiver(post_save, sender=SiteSettings)
+@receiver(post_delete, sender=SiteSettings)
+def clear_site_settings_cache(sender, **kwargs):
+    """Make the next get_settings() call re-read the row after any change."""
+    sender.clear_cache()
+
+
+@receiver(setting_changed)
+def clear_site_settings_cache_on_setting_change(setting, **kwargs):
+    """
+    Drop the cached row when SITE_SETTINGS_CACHE_SECONDS is overridden.
+
+    TestCase rollbacks don't send post_save/post_delete, so a row cached
+    while a test had the cache on must not outlive that test.
+    """
+    if setting == "SITE_SETTINGS_CACHE_SECONDS":
+        SiteSettings.clear_cache()
+
 
 class AdminAuditLog(models.Model):
     """
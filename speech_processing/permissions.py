@@ -0,0 +1,32 @@
+"""
+Access checks for speech processing views.
+
+Audio endpoints are open to the document owner and to anyone the document
+has been shared with. Keeping that rule here means every view asks the same
+question the same way.
+"""
+
+from speech_processing.models import DocumentSharing
+
+
+def user_can_access_document(user, document) -> bool:
+    """
+    Return True if the user owns the document or it has been shared with them.
+
+    Ownership is decided from the foreign key ids, so neither the owner nor
+    the document's user row is loaded; only non-owners cost a query, a single
+    EXISTS on DocumentSharing.
+
+    Args:
+        user: The requesting user
+        document: Document being accessed
+
+    Returns:
+        True if the user may read the document's audio
+    """
+    if document.user_id == user.id:
+        return True
+
+    return DocumentSharing.objects.filter(
+        document_id=document.id, shared_with_id=user.id
+    ).exists()
@@ -36,6 +36,24 @@ class AudioGenerationError(Exception):
     pass
 
 
+class TransientAudioGenerationError(AudioGenerationError):
+    """
+    Audio generation failure that may succeed if retried later.
+
+    Raised for throttling, AWS 5xx responses and dropped connections.
+    Anything else (bad voice, missing bucket, credentials) is permanent and
+    stays a plain AudioGenerationError, so the task doesn't retry it.
+    """
+
+    pass
+
+
+def _is_server_error(error: botocore.exceptions.ClientError) -> bool:
+    """Return True if AWS answered a ClientError with a 5xx status."""
+    status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+    return status >= 500
+
+
 class PollyService:
     """Service for interacting with AWS Polly for TTS generation."""
 
@@ -131,6 +149,7 @@ class PollyService:
             Bytes containing MP3 audio data
 
         Raises:
+            TransientAudioGenerationError: Throttling, 5xx or network errors
             AudioGenerationError: With user-friendly message describing the error
 
         """
@@ -156,7 +175,7 @@ class PollyService:
 
             if error_code == "ThrottlingException":
                 logger.warning(f"Polly throttled: {error_message}")
-                raise AudioGenerationError(
+                raise TransientAudioGenerationError(
                     "AWS service is busy. Please try again in a moment."
                 )
             elif error_code == "InvalidParameterValue":
@@ -166,7 +185,7 @@ class PollyService:
                 )
             elif error_code == "ServiceUnavailable":
                 logger.warning(f"Polly service unavailable: {error_message}")
-                raise AudioGenerationError(
+                raise TransientAudioGenerationError(
                     "Audio service is temporarily unavailable. Please try again later."
                 )
             elif error_code == "AccessDenied":
@@ -174,6 +193,11 @@ class PollyService:
                 raise AudioGenerationError(
                     "System error: AWS access issue. Please contact support."
                 )
+            elif _is_server_error(e):
+                logger.error(f"Polly AWS error ({error_code}): {error_message}")
+                raise TransientAudioGenerationError(
+                    "Audio generation failed. Please try again later."
+                )
             else:
                 logger.error(f"Polly AWS error ({error_code}): {error_message}")
                 raise AudioGenerationError(
@@ -182,7 +206,7 @@ class PollyService:
 
         except botocore.exceptions.ConnectionError as e:
             logger.error(f"Connection error to Polly: {str(e)}")
-            raise AudioGenerationError(
+            raise TransientAudioGenerationError(
                 "Network error connecting to audio service. Please try again."
             )
 
@@ -255,6 +279,7 @@ class PollyService:
             The S3 key if upload successful
 
         Raises:
+            TransientAudioGenerationError: 5xx or network errors
             AudioGenerationError: With user-friendly error message
         """
         try:
@@ -286,6 +311,12 @@ class PollyService:
                 raise AudioGenerationError(
                     "System error: Cannot access storage. Contact support."
                 )
+            elif _is_server_error(e):
+                # e.g. SlowDown / InternalError; S3 asks callers to back off
+                logger.error(f"S3 error ({error_code}): {error_message}")
+                raise TransientAudioGenerationError(
+                    "Failed to save audio file. Please try again later."
+                )
             else:
                 logger.error(f"S3 error ({error_code}): {error_message}")
                 raise AudioGenerationError(
@@ -294,7 +325,7 @@ class PollyService:
 
         except botocore.exceptions.ConnectionError as e:
             logger.error(f"Connection error to S3: {str(e)}")
-            raise AudioGenerationError(
+            raise TransientAudioGenerationError(
                 "Network error accessing storage. Please try again."
             )
 
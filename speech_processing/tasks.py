@@ -2,20 +2,63 @@
 Celery tasks for audio generation and processing.
 """
 
+from botocore.config import Config
 from celery import shared_task
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from speech_processing.services import AudioGenerationService
+from speech_processing.services import (
+    AudioGenerationError,
+    AudioGenerationService,
+    TransientAudioGenerationError,
+)
 from speech_processing.models import Audio, AudioGenerationStatus
 from speech_processing.logging_utils import log_generation_complete
 from core.task_utils import log_task_failure
+import boto3
 import logging
 import pypandoc
 import re
 import random
+import threading
 
 logger = logging.getLogger(__name__)
 User = get_user_model()
 
+_s3_client = None
+_s3_client_lock = threading.Lock()
+
+# DeleteObjects accepts at most 1,000 keys per request
+S3_DELETE_BATCH_SIZE = 1000
+
+
+def get_s3_client():
+    """
+    Return the S3 client shared by every task in this worker process.
+
+    Building a client resolves credentials and a fresh connection pool, so
+    it is done once per process and reused; boto3 clients are thread-safe
+    once created. Retries use botocore's adaptive mode, which backs off
+    exponentially and rate-limits itself when S3 throttles.
+    """
+    global _s3_client
+    if _s3_client is None:
+        with _s3_client_lock:
+            if _s3_client is None:
+                _s3_client = boto3.client(
+                    "s3",
+                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                    region_name=settings.AWS_S3_REGION_NAME,
+                    config=Config(
+                        max_pool_connections=32,
+                        tcp_keepalive=True,
+                        connect_timeout=3,
+                        read_timeout=30,
+                        retries={"mode": "adaptive", "max_attempts": 5},
+                    ),
+                )
+    return _s3_client
+
 
 def normalize_text_for_tts(markdown_or_plain_text: str) -> str:
     """
@@ -148,9 +191,17 @@ def generate_audio_task(self, audio_id):
                 retry_count=self.request.retries,
             )
 
+        # Only retry failures that can clear up on their own. The service
+        # marks throttling, 5xx and network errors as transient; any other
+        # AudioGenerationError (bad voice, empty text, missing bucket) would
+        # fail the same way again. Unexpected exceptions keep retrying.
+        retryable = not isinstance(e, AudioGenerationError) or isinstance(
+            e, TransientAudioGenerationError
+        )
+
         # Retry the task if retries available
         # Use exponential backoff with jitter to prevent thundering herd
-        if self.request.retries < self.max_retries:
+        if retryable and self.request.retries < self.max_retries:
             # Calculate countdown with exponential backoff + random jitter
             # Base countdown: 60, 120, 240 seconds (for retries 0, 1, 2)
             base_countdown = 60 * (2**self.request.retries)
@@ -210,7 +261,7 @@ def check_audio_generation_status(audio_id):
 @shared_task
 def export_audit_logs_to_s3(start_date=None, end_date=None, user_id=None):
     """
-    Export audit logs to S3 in JSON Lines format.
+    Export audit logs to S3 as gzip-compressed JSON Lines.
     Can be run manually with specific date range and user, or monthly via Celery Beat.
 
     Args:
@@ -221,13 +272,13 @@ def export_audit_logs_to_s3(start_date=None, end_date=None, user_id=None):
     Returns:
         dict with success status and details
     """
+    import gzip
     import json
-    import boto3
+    from boto3.s3.transfer import TransferConfig
     from datetime import datetime, timedelta
     from django.utils import timezone
-    from django.conf import settings
     from speech_processing.models import AudioAccessLog
-    from io import StringIO
+    from tempfile import SpooledTemporaryFile
 
     try:
         # Parse date parameters or use previous month
@@ -257,10 +308,12 @@ def export_audit_logs_to_s3(start_date=None, end_date=None, user_id=None):
             f"{f' for user {user_id}' if user_id else ''}"
         )
 
-        # Query logs for the date range
+        # Query logs for the date range. The bounds are already midnights, so
+        # a half-open range on the raw column selects whole days and, unlike
+        # a __date lookup, can still use the timestamp indexes
         logs = AudioAccessLog.objects.filter(
             timestamp__gte=first_day_prev_month, timestamp__lt=first_day_this_month
-        ).select_related("user", "audio", "document")
+        )
 
         # Filter by user if specified
         if user_id:
@@ -278,44 +331,69 @@ def export_audit_logs_to_s3(start_date=None, end_date=None, user_id=None):
                 "log_count": 0,
             }
 
-        # Convert logs to JSON Lines format
-        jsonl_data = StringIO()
-
-        for log in logs:
-            log_dict = {
-                "timestamp": log.timestamp.isoformat(),
-                "user_id": log.user.id,
-                "user_email": log.user.email,
-                "action": log.action,
-                "status": log.status,
-                "audio_id": log.audio.id if log.audio else None,
-                "audio_voice": log.audio.voice if log.audio else None,
-                "document_id": log.document.id if log.document else None,
-                "document_title": log.document.title if log.document else None,
-                "ip_address": log.ip_address,
-                "user_agent": log.user_agent,
-                "error_message": log.error_message,
-            }
-            jsonl_data.write(json.dumps(log_dict) + "\n")
-
-        # Upload to S3
-        s3_client = boto3.client(
-            "s3",
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            region_name=settings.AWS_S3_REGION_NAME,
-        )
+        s3_client = get_s3_client()
 
-        s3_key = f"audit-logs/{year}/{month:02d}/audit-logs-{year}-{month:02d}.jsonl"
+        s3_key = (
+            f"audit-logs/{year}/{month:02d}/audit-logs-{year}-{month:02d}.jsonl.gz"
+        )
         bucket_name = settings.AWS_STORAGE_BUCKET_NAME
 
-        s3_client.put_object(
-            Bucket=bucket_name,
-            Key=s3_key,
-            Body=jsonl_data.getvalue().encode("utf-8"),
-            ContentType="application/x-ndjson",
-            ServerSideEncryption="AES256",
-        )
+        # Fetch plain dicts in chunks rather than model instances, so memory
+        # stays flat however many logs the range covers
+        rows = logs.values(
+            "timestamp",
+            "user_id",
+            "user__email",
+            "action",
+            "status",
+            "audio_id",
+            "audio__voice",
+            "document_id",
+            "document__title",
+            "ip_address",
+            "user_agent",
+            "error_message",
+        ).iterator(chunk_size=2000)
+
+        # Write gzipped JSON Lines to a buffer that spills to disk past 10 MB,
+        # so a large export never has to sit in memory as one string
+        with SpooledTemporaryFile(max_size=10 * 1024 * 1024) as export_file:
+            with gzip.GzipFile(
+                fileobj=export_file, mode="wb", compresslevel=5
+            ) as jsonl_file:
+                for row in rows:
+                    log_dict = {
+                        "timestamp": row["timestamp"].isoformat(),
+                        "user_id": row["user_id"],
+                        "user_email": row["user__email"],
+                        "action": row["action"],
+                        "status": row["status"],
+                        "audio_id": row["audio_id"],
+                        "audio_voice": row["audio__voice"],
+                        "document_id": row["document_id"],
+                        "document_title": row["document__title"],
+                        "ip_address": row["ip_address"],
+                        "user_agent": row["user_agent"],
+                        "error_message": row["error_message"],
+                    }
+                    jsonl_file.write((json.dumps(log_dict) + "\n").encode("utf-8"))
+
+            # upload_fileobj streams the file and switches to a multipart
+            # upload in 8 MB parts for large exports
+            export_file.seek(0)
+            s3_client.upload_fileobj(
+                Fileobj=export_file,
+                Bucket=bucket_name,
+                Key=s3_key,
+                ExtraArgs={
+                    "ContentType": "application/gzip",
+                    "ServerSideEncryption": "AES256",
+                },
+                Config=TransferConfig(
+                    multipart_threshold=8 * 1024 * 1024,
+                    multipart_chunksize=8 * 1024 * 1024,
+                ),
+            )
 
         logger.info(
             f"Successfully exported {log_count} audit logs to s3://{bucket_name}/{s3_key}"
@@ -352,12 +430,13 @@ def check_expired_audios():
     Returns:
         dict with success status and statistics
     """
+    from datetime import timedelta
     from django.core.mail import send_mail
+    from django.db import transaction
+    from django.db.models.functions import Coalesce
     from django.template.loader import render_to_string
-    from django.conf import settings
     from django.utils import timezone
     from speech_processing.models import Audio, AudioLifetimeStatus, SiteSettings
-    import boto3
 
     try:
         logger.info("Starting expired audios check task")
@@ -366,11 +445,21 @@ def check_expired_audios():
         site_settings = SiteSettings.get_settings()
         auto_delete_enabled = site_settings.auto_delete_expired_enabled
 
+        # An audio expires once it has gone unplayed (or, if never played,
+        # existed) for the whole retention period; see Audio.is_expired
+        now = timezone.now()
+        retention_days = site_settings.audio_retention_months * 30
+        expiry_cutoff = now - timedelta(days=retention_days)
+
         # Get active audios only
         active_audios = Audio.objects.filter(
             lifetime_status=AudioLifetimeStatus.ACTIVE,
             status=AudioGenerationStatus.COMPLETED,
-        ).select_related("generated_by", "page__document")
+        ).annotate(
+            # Same expression as Audio's audio_active_expiry_idx, so the
+            # expiry and warning range filters can use that index
+            last_active_at=Coalesce("last_played_at", "created_at")
+        )
 
         warnings_sent = 0
         audios_deleted = 0
@@ -379,47 +468,88 @@ def check_expired_audios():
         # Track users who need warnings (to send one email per user)
         users_needing_warnings = {}
 
-        # Check each audio
-        for audio in active_audios:
-            try:
-                # Check if expired
-                if audio.is_expired() and auto_delete_enabled:
-                    # Delete from S3
-                    try:
-                        s3_client = boto3.client(
-                            "s3",
-                            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                            region_name=settings.AWS_S3_REGION_NAME,
-                        )
-                        s3_client.delete_object(
-                            Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=audio.s3_key
-                        )
-                        logger.info(f"Deleted S3 object: {audio.s3_key}")
-                    except Exception as s3_error:
-                        logger.error(
-                            f"Failed to delete S3 object {audio.s3_key}: {str(s3_error)}"
-                        )
-                        errors.append(
-                            {
-                                "audio_id": audio.id,
-                                "action": "s3_delete",
-                                "error": str(s3_error),
-                            }
-                        )
-
-                    # Mark audio as expired
-                    audio.lifetime_status = AudioLifetimeStatus.EXPIRED
-                    audio.deleted_at = timezone.now()
-                    audio.save()
-
-                    audios_deleted += 1
-                    logger.info(
-                        f"Marked audio {audio.id} as expired (voice: {audio.voice}, user: {audio.generated_by.email})"
+        if auto_delete_enabled:
+            expired_audios = active_audios.filter(last_active_at__lt=expiry_cutoff)
+
+            # Lock the expired rows while reading their keys, then expire
+            # exactly those ids in one UPDATE. Without the lock a play landing
+            # between the two queries would keep its row ACTIVE while its key
+            # was still queued below, deleting the file of a live audio.
+            with transaction.atomic():
+                expired_rows = list(
+                    expired_audios.select_for_update()
+                    .order_by()
+                    .values_list("pk", "s3_key")
+                )
+                if expired_rows:
+                    audios_deleted = Audio.objects.filter(
+                        pk__in=[pk for pk, _ in expired_rows]
+                    ).update(
+                        lifetime_status=AudioLifetimeStatus.EXPIRED,
+                        deleted_at=now,
+                    )
+                    logger.info(f"Expired {audios_deleted} audios")
+            # Error entries report the audio as well as the key it owned
+            audio_ids_by_key = {s3_key: pk for pk, s3_key in expired_rows if s3_key}
+
+            # Delete from S3 in batches, one request per 1,000 objects
+            s3_keys = list(audio_ids_by_key)
+            for start in range(0, len(s3_keys), S3_DELETE_BATCH_SIZE):
+                batch = s3_keys[start : start + S3_DELETE_BATCH_SIZE]
+                try:
+                    response = get_s3_client().delete_objects(
+                        Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+                        Delete={
+                            "Objects": [{"Key": key} for key in batch],
+                            "Quiet": True,
+                        },
+                    )
+                except Exception as s3_error:
+                    logger.error(
+                        f"Failed to delete {len(batch)} S3 objects: {str(s3_error)}"
                     )
+                    errors.extend(
+                        {
+                            "audio_id": audio_ids_by_key[key],
+                            "s3_key": key,
+                            "action": "s3_delete",
+                            "error": str(s3_error),
+                        }
+                        for key in batch
+                    )
+                    continue
+
+                # Quiet mode only reports the keys that could not be deleted
+                failures = response.get("Errors", [])
+                for failure in failures:
+                    logger.error(
+                        f"Failed to delete S3 object {failure['Key']}: "
+                        f"{failure.get('Message', failure.get('Code'))}"
+                    )
+                    errors.append(
+                        {
+                            "audio_id": audio_ids_by_key[failure["Key"]],
+                            "s3_key": failure["Key"],
+                            "action": "s3_delete",
+                            "error": failure.get("Message", failure.get("Code")),
+                        }
+                    )
+                logger.info(f"Deleted {len(batch) - len(failures)} S3 objects")
+
+        # Only audios 1-30 days from expiry can need a warning, so fetch
+        # just that window (with the users and documents the emails show)
+        warning_candidates = active_audios.filter(
+            last_active_at__gte=expiry_cutoff + timedelta(days=1),
+            last_active_at__lt=expiry_cutoff + timedelta(days=31),
+        ).select_related("generated_by", "page__document")
 
+        for audio in warning_candidates:
+            try:
                 # Check if needs warning (30 days before expiry)
-                elif audio.needs_expiry_warning():
+                if audio.needs_expiry_warning(site_settings):
+                    # Computed once here so the email templates don't look up
+                    # the settings again for every audio they render
+                    audio.days_left = audio.days_until_expiry(site_settings)
                     user_email = audio.generated_by.email
                     if user_email not in users_needing_warnings:
                         users_needing_warnings[user_email] = {
@@ -492,7 +622,7 @@ def check_expired_audios():
             "message": f"Expiry check completed: {audios_deleted} deleted, {warnings_sent} warnings sent",
             "audios_deleted": audios_deleted,
             "warnings_sent": warnings_sent,
-            "total_checked": active_audios.count(),
+            "total_checked": active_audios.count() + audios_deleted,
             "timestamp": timezone.now().isoformat(),
         }
 
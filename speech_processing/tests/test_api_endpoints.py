@@ -5,65 +5,72 @@ Tests permissions, quota enforcement, and audio lifecycle.
 
 import json
 from unittest.mock import patch, MagicMock
-from django.test import TestCase, Client
+from django.test import TestCase, Client, RequestFactory
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from django.http import JsonResponse
-from document_processing.models import Document, DocumentPage
 from speech_processing.models import (
     Audio,
     AudioGenerationStatus,
     AudioLifetimeStatus,
     TTSVoice,
     SiteSettings,
+    DocumentSharing,
+    SharingPermission,
 )
+from speech_processing.views import (
+    generate_audio,
+    delete_audio,
+    retry_audio,
+)
+from speech_processing.tests.utils import DocumentFixtureMixin
 
 User = get_user_model()
 
 
-class GenerateAudioAPITests(TestCase):
+class GenerateAudioAPITests(DocumentFixtureMixin, TestCase):
     """Test POST /speech/generate/<page_id>/ endpoint."""
 
-    def setUp(self):
-        """Create test data."""
-        self.client = Client()
-        self.owner = User.objects.create_user(
-            username="testuser28", email="owner@example.com", password="testpass123"
-        )
-        self.other_user = User.objects.create_user(
-            username="testuser29", email="other@example.com", password="testpass123"
-        )
+    page_content = "Test content for audio generation."
 
-        self.document = Document.objects.create(
-            user=self.owner,
-            title="Test Doc",
-            source_content="test.pdf",
-            source_type="FILE",
-            status="COMPLETED",
-        )
-        self.page = DocumentPage.objects.create(
-            document=self.document,
-            page_number=1,
-            markdown_content="Test content for audio generation.",
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Patch the Celery dispatch once for the whole class
+        cls._task_patcher = patch("speech_processing.views.generate_audio_task.delay")
+        cls.mock_task = cls._task_patcher.start()
+        cls.addClassCleanup(cls._task_patcher.stop)
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create test data."""
+        super().setUpTestData()
+        cls.other_user = User.objects.create_user(
+            username="other", email="other@example.com", password="testpass123"
         )
 
         # Ensure settings exist
-        self.settings = SiteSettings.get_settings()
-        self.settings.audio_generation_enabled = True
-        self.settings.max_audios_per_page = 4
-        self.settings.save()
+        cls.settings = SiteSettings.get_settings()
+        cls.settings.audio_generation_enabled = True
+        cls.settings.max_audios_per_page = 4
+        cls.settings.save()
 
-    @patch("speech_processing.views.generate_audio_task.delay")
-    def test_generate_audio_success(self, mock_task):
+    def setUp(self):
+        super().setUp()
+        self.mock_task.reset_mock()
+        self.client = Client()
+        self.factory = RequestFactory()
+
+    def test_generate_audio_success(self):
         """Test successful audio generation by owner."""
-        self.client.login(email="owner@example.com", password="testpass123")
+        self.client.force_login(self.owner)
 
         url = reverse(
             "speech_processing:generate_audio", kwargs={"page_id": self.page.id}
         )
         response = self.client.post(
             url,
-            data=json.dumps({"voice_id": "Joanna"}),
+            data={"voice_id": "Joanna"},
             content_type="application/json",
         )
 
@@ -90,7 +97,7 @@ class GenerateAudioAPITests(TestCase):
         )
         response = self.client.post(
             url,
-            data=json.dumps({"voice_id": "Joanna"}),
+            data={"voice_id": "Joanna"},
             content_type="application/json",
         )
 
@@ -98,29 +105,26 @@ class GenerateAudioAPITests(TestCase):
 
     def test_generate_audio_unauthorized_user(self):
         """Test generation fails for user without access."""
-        self.client.login(email="other@example.com", password="testpass123")
-
         url = reverse(
             "speech_processing:generate_audio", kwargs={"page_id": self.page.id}
         )
-        response = self.client.post(
+        request = self.factory.post(
             url,
-            data=json.dumps({"voice_id": "Matthew"}),
+            data={"voice_id": "Matthew"},
             content_type="application/json",
         )
+        request.user = self.other_user
+        response = generate_audio(request, page_id=self.page.id)
 
         self.assertEqual(response.status_code, 403)
-        data = response.json()
+        data = json.loads(response.content)
         self.assertFalse(data["success"])
         # Check for either 'permission' or 'access' in error message
         error_lower = data["error"].lower()
         self.assertTrue("permission" in error_lower or "access" in error_lower)
 
-    @patch("speech_processing.views.generate_audio_task.delay")
-    def test_generate_audio_quota_exceeded(self, mock_task):
+    def test_generate_audio_quota_exceeded(self):
         """Test generation fails when quota is full."""
-        self.client.login(email="owner@example.com", password="testpass123")
-
         # Create 4 audios (at quota limit)
         voices = [TTSVoice.JOANNA, TTSVoice.MATTHEW, TTSVoice.IVY, TTSVoice.JOEY]
         for voice in voices:
@@ -135,25 +139,24 @@ class GenerateAudioAPITests(TestCase):
         url = reverse(
             "speech_processing:generate_audio", kwargs={"page_id": self.page.id}
         )
-        response = self.client.post(
+        request = self.factory.post(
             url,
-            data=json.dumps({"voice_id": "Kendra"}),
+            data={"voice_id": "Kendra"},
             content_type="application/json",
         )
+        request.user = self.owner
+        response = generate_audio(request, page_id=self.page.id)
 
         self.assertEqual(response.status_code, 403)
-        data = response.json()
+        data = json.loads(response.content)
         self.assertFalse(data["success"])
         self.assertIn("quota", data["error"].lower())
 
         # Task should not be called
-        mock_task.assert_not_called()
+        self.mock_task.assert_not_called()
 
-    @patch("speech_processing.views.generate_audio_task.delay")
-    def test_generate_audio_duplicate_voice(self, mock_task):
+    def test_generate_audio_duplicate_voice(self):
         """Test generation fails for duplicate active voice."""
-        self.client.login(email="owner@example.com", password="testpass123")
-
         # Create audio with Joanna voice
         Audio.objects.create(
             page=self.page,
@@ -167,32 +170,34 @@ class GenerateAudioAPITests(TestCase):
         url = reverse(
             "speech_processing:generate_audio", kwargs={"page_id": self.page.id}
         )
-        response = self.client.post(
+        request = self.factory.post(
             url,
-            data=json.dumps({"voice_id": "Joanna"}),
+            data={"voice_id": "Joanna"},
             content_type="application/json",
         )
+        request.user = self.owner
+        response = generate_audio(request, page_id=self.page.id)
 
         self.assertEqual(response.status_code, 403)
-        data = response.json()
+        data = json.loads(response.content)
         self.assertFalse(data["success"])
         self.assertIn("voice", data["error"].lower())
 
-        mock_task.assert_not_called()
+        self.mock_task.assert_not_called()
 
     def test_generate_audio_missing_voice_id(self):
         """Test generation fails with missing voice_id."""
-        self.client.login(email="owner@example.com", password="testpass123")
-
         url = reverse(
             "speech_processing:generate_audio", kwargs={"page_id": self.page.id}
         )
-        response = self.client.post(
-            url, data=json.dumps({}), content_type="application/json"
+        request = self.factory.post(
+            url, data={}, content_type="application/json"
         )
+        request.user = self.owner
+        response = generate_audio(request, page_id=self.page.id)
 
         self.assertEqual(response.status_code, 400)
-        data = response.json()
+        data = json.loads(response.content)
         self.assertFalse(data["success"])
         # Check for 'voice' and 'id' (covers "voice id" or "voice_id")
         error_lower = data["error"].lower()
@@ -200,56 +205,63 @@ class GenerateAudioAPITests(TestCase):
 
     def test_generate_audio_generation_disabled(self):
         """Test generation fails when globally disabled."""
-        self.settings.audio_generation_enabled = False
-        self.settings.save()
-
-        self.client.login(email="owner@example.com", password="testpass123")
-
         url = reverse(
             "speech_processing:generate_audio", kwargs={"page_id": self.page.id}
         )
-        response = self.client.post(
+        request = self.factory.post(
             url,
-            data=json.dumps({"voice_id": "Joanna"}),
+            data={"voice_id": "Joanna"},
             content_type="application/json",
         )
+        request.user = self.owner
+
+        # Stub the singleton instead of writing the flag to the database
+        with patch.object(SiteSettings, "get_settings") as mock_get_settings:
+            mock_get_settings.return_value = MagicMock(
+                audio_generation_enabled=False, max_audios_per_page=4
+            )
+            response = generate_audio(request, page_id=self.page.id)
 
         self.assertEqual(response.status_code, 403)
-        data = response.json()
+        data = json.loads(response.content)
         self.assertFalse(data["success"])
         self.assertIn("disabled", data["error"].lower())
 
 
-class AudioStatusAPITests(TestCase):
+class AudioStatusAPITests(DocumentFixtureMixin, TestCase):
     """Test GET /speech/audio/<audio_id>/status/ endpoint."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Create test data."""
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username="testuser30", email="test@example.com", password="testpass123"
-        )
-        self.document = Document.objects.create(
-            user=self.user,
-            title="Test Doc",
-            source_content="test.pdf",
-            source_type="FILE",
-            status="COMPLETED",
-        )
-        self.page = DocumentPage.objects.create(
-            document=self.document, page_number=1, markdown_content="Test content"
-        )
-        self.audio = Audio.objects.create(
-            page=self.page,
+        super().setUpTestData()
+        cls.audio = Audio.objects.create(
+            page=cls.page,
             voice=TTSVoice.JOANNA,
-            generated_by=self.user,
+            generated_by=cls.owner,
             s3_key="audios/test.mp3",
             status=AudioGenerationStatus.COMPLETED,
         )
+        cls.shared_user = User.objects.create_user(
+            username="shareduser", email="shared@example.com", password="testpass123"
+        )
+        cls.stranger = User.objects.create_user(
+            username="stranger", email="stranger@example.com", password="testpass123"
+        )
+        DocumentSharing.objects.create(
+            document=cls.document,
+            shared_with=cls.shared_user,
+            permission=SharingPermission.VIEW_ONLY,
+            shared_by=cls.owner,
+        )
+
+    def setUp(self):
+        super().setUp()
+        self.client = Client()
 
     def test_audio_status_success(self):
         """Test successful status check."""
-        self.client.login(email="test@example.com", password="testpass123")
+        self.client.force_login(self.owner)
 
         url = reverse(
             "speech_processing:audio_status", kwargs={"audio_id": self.audio.id}
@@ -263,6 +275,24 @@ class AudioStatusAPITests(TestCase):
         self.assertEqual(data["voice"], "Joanna")
         self.assertIn("s3_url", data)
 
+    def test_audio_status_access_query_counts(self):
+        """Test the access check costs one EXISTS, and only for non-owners."""
+        url = reverse(
+            "speech_processing:audio_status", kwargs={"audio_id": self.audio.id}
+        )
+        # Session + user, then the audio joined to its page, document and
+        # creator; non-owners add the DocumentSharing EXISTS
+        for user, status_code, queries in [
+            (self.owner, 200, 3),
+            (self.shared_user, 200, 4),
+            (self.stranger, 403, 4),
+        ]:
+            with self.subTest(user=user.username):
+                self.client.force_login(user)
+                with self.assertNumQueries(queries):
+                    response = self.client.get(url)
+                self.assertEqual(response.status_code, status_code)
+
     def test_audio_status_unauthenticated(self):
         """Test status check fails for unauthenticated user."""
         url = reverse(
@@ -273,44 +303,49 @@ class AudioStatusAPITests(TestCase):
         self.assertEqual(response.status_code, 302)  # Redirect to login
 
 
-class DownloadAudioAPITests(TestCase):
+class DownloadAudioAPITests(DocumentFixtureMixin, TestCase):
     """Test GET /speech/audio/<audio_id>/download/ endpoint."""
 
-    def setUp(self):
-        """Create test data."""
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username="testuser31", email="test@example.com", password="testpass123"
-        )
-        self.document = Document.objects.create(
-            user=self.user,
-            title="Test Doc",
-            source_content="test.pdf",
-            source_type="FILE",
-            status="COMPLETED",
-        )
-        self.page = DocumentPage.objects.create(
-            document=self.document, page_number=1, markdown_content="Test content"
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._presigned_patcher = patch(
+            "speech_processing.services.AudioGenerationService.get_presigned_url"
         )
-        self.audio = Audio.objects.create(
-            page=self.page,
+        cls.mock_presigned = cls._presigned_patcher.start()
+        cls.addClassCleanup(cls._presigned_patcher.stop)
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create test data."""
+        super().setUpTestData()
+        cls.audio = Audio.objects.create(
+            page=cls.page,
             voice=TTSVoice.MATTHEW,
-            generated_by=self.user,
+            generated_by=cls.owner,
             s3_key="audios/test.mp3",
             status=AudioGenerationStatus.COMPLETED,
         )
 
-    @patch("speech_processing.services.AudioGenerationService.get_presigned_url")
-    def test_download_audio_success(self, mock_presigned):
+    def setUp(self):
+        super().setUp()
+        self.mock_presigned.reset_mock()
+        self.client = Client()
+
+    def test_download_audio_success(self):
         """Test successful download URL generation."""
-        mock_presigned.return_value = "https://s3.amazonaws.com/presigned_url"
+        self.mock_presigned.return_value = "https://s3.amazonaws.com/presigned_url"
 
-        self.client.login(email="test@example.com", password="testpass123")
+        self.client.force_login(self.owner)
 
         url = reverse(
             "speech_processing:download_audio", kwargs={"audio_id": self.audio.id}
         )
-        response = self.client.get(url)
+        # Session + user, the audio joined to its page and document, one
+        # UPDATE for last_played_at, then the audit log's audio lookup and
+        # INSERT
+        with self.assertNumQueries(6):
+            response = self.client.get(url)
 
         self.assertEqual(response.status_code, 200)
         data = response.json()
@@ -318,121 +353,112 @@ class DownloadAudioAPITests(TestCase):
         self.assertEqual(data["download_url"], "https://s3.amazonaws.com/presigned_url")
 
         # Verify last_played_at was updated
-        self.audio.refresh_from_db()
+        self.audio.refresh_from_db(fields=["last_played_at"])
         self.assertIsNotNone(self.audio.last_played_at)
 
 
-class DeleteAudioAPITests(TestCase):
+class DeleteAudioAPITests(DocumentFixtureMixin, TestCase):
     """Test DELETE /speech/audio/<audio_id>/delete/ endpoint."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Create test data."""
-        self.client = Client()
-        self.owner = User.objects.create_user(
-            username="testuser32", email="owner@example.com", password="testpass123"
-        )
-        self.other_user = User.objects.create_user(
-            username="testuser33", email="other@example.com", password="testpass123"
-        )
-        self.document = Document.objects.create(
-            user=self.owner,
-            title="Test Doc",
-            source_content="test.pdf",
-            source_type="FILE",
-            status="COMPLETED",
+        super().setUpTestData()
+        cls.other_user = User.objects.create_user(
+            username="other", email="other@example.com", password="testpass123"
         )
-        self.page = DocumentPage.objects.create(
-            document=self.document, page_number=1, markdown_content="Test content"
-        )
-        self.audio = Audio.objects.create(
-            page=self.page,
+        cls.audio = Audio.objects.create(
+            page=cls.page,
             voice=TTSVoice.IVY,
-            generated_by=self.owner,
+            generated_by=cls.owner,
             s3_key="audios/test.mp3",
             status=AudioGenerationStatus.COMPLETED,
         )
 
+    def setUp(self):
+        super().setUp()
+        self.client = Client()
+        self.factory = RequestFactory()
+
     def test_delete_audio_by_owner(self):
         """Test owner can delete audio."""
-        self.client.login(email="owner@example.com", password="testpass123")
+        self.client.force_login(self.owner)
 
         url = reverse(
             "speech_processing:delete_audio", kwargs={"audio_id": self.audio.id}
         )
-        response = self.client.delete(url)
+        # Session + user, the audio joined to its page, document and creator,
+        # the soft-delete UPDATE, then the audit log's audio lookup and INSERT
+        with self.assertNumQueries(6):
+            response = self.client.delete(url)
 
         self.assertEqual(response.status_code, 200)
         data = response.json()
         self.assertTrue(data["success"])
 
         # Verify soft delete
-        self.audio.refresh_from_db()
+        self.audio.refresh_from_db(fields=["lifetime_status", "deleted_at"])
         self.assertEqual(self.audio.lifetime_status, AudioLifetimeStatus.DELETED)
         self.assertIsNotNone(self.audio.deleted_at)
 
     def test_delete_audio_by_non_owner(self):
         """Test non-owner cannot delete audio."""
-        self.client.login(email="other@example.com", password="testpass123")
-
         url = reverse(
             "speech_processing:delete_audio", kwargs={"audio_id": self.audio.id}
         )
-        response = self.client.delete(url)
+        request = self.factory.delete(url)
+        request.user = self.other_user
+        response = delete_audio(request, audio_id=self.audio.id)
 
         self.assertEqual(response.status_code, 403)
-        data = response.json()
+        data = json.loads(response.content)
         self.assertFalse(data["success"])
         # Check for either 'permission' or 'owner' in error message
         error_lower = data["error"].lower()
         self.assertTrue("permission" in error_lower or "owner" in error_lower)
 
         # Audio should not be deleted
-        self.audio.refresh_from_db()
+        self.audio.refresh_from_db(fields=["lifetime_status", "deleted_at"])
         self.assertEqual(self.audio.lifetime_status, AudioLifetimeStatus.ACTIVE)
 
 
-class PageAudiosListAPITests(TestCase):
+class PageAudiosListAPITests(DocumentFixtureMixin, TestCase):
     """Test GET /speech/page/<page_id>/audios/ endpoint."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Create test data."""
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username="testuser34", email="test@example.com", password="testpass123"
-        )
-        self.document = Document.objects.create(
-            user=self.user,
-            title="Test Doc",
-            source_content="test.pdf",
-            source_type="FILE",
-            status="COMPLETED",
-        )
-        self.page = DocumentPage.objects.create(
-            document=self.document, page_number=1, markdown_content="Test content"
-        )
+        super().setUpTestData()
 
         # Create 2 audios
         Audio.objects.create(
-            page=self.page,
+            page=cls.page,
             voice=TTSVoice.JOANNA,
-            generated_by=self.user,
+            generated_by=cls.owner,
             s3_key="audios/joanna.mp3",
             status=AudioGenerationStatus.COMPLETED,
         )
         Audio.objects.create(
-            page=self.page,
+            page=cls.page,
             voice=TTSVoice.MATTHEW,
-            generated_by=self.user,
+            generated_by=cls.owner,
             s3_key="audios/matthew.mp3",
             status=AudioGenerationStatus.COMPLETED,
         )
 
+    def setUp(self):
+        super().setUp()
+        self.client = Client()
+
     def test_list_page_audios_success(self):
         """Test successful listing of page audios."""
-        self.client.login(email="test@example.com", password="testpass123")
+        self.client.force_login(self.owner)
 
         url = reverse("speech_processing:page_audios", kwargs={"page_id": self.page.id})
-        response = self.client.get(url)
+        # Session + user, page joined to its document, the audios, then
+        # SiteSettings once for the quota and every audio's expiry
+        with self.assertNumQueries(5):
+            response = self.client.get(url)
 
         self.assertEqual(response.status_code, 200)
         data = response.json()
@@ -450,69 +476,59 @@ class PageAudiosListAPITests(TestCase):
         self.assertIn("Matthew", data["voices"]["used"])
 
 
-class AudioRetryAPITests(TestCase):
+class AudioRetryAPITests(DocumentFixtureMixin, TestCase):
     """Test POST /speech/audio/<audio_id>/retry/ endpoint."""
 
-    def setUp(self):
-        """Create test data."""
-        self.client = Client()
-        self.owner = User.objects.create_user(
-            username="testuser35", email="owner@example.com", password="testpass123"
-        )
-        self.other_user = User.objects.create_user(
-            username="testuser36", email="other@example.com", password="testpass123"
-        )
-        self.shared_user = User.objects.create_user(
-            username="testuser37", email="shared@example.com", password="testpass123"
-        )
+    page_content = "Test content for audio retry."
 
-        self.document = Document.objects.create(
-            user=self.owner,
-            title="Test Doc",
-            source_content="test.pdf",
-            source_type="FILE",
-            status="COMPLETED",
+    @classmethod
+    def setUpTestData(cls):
+        """Create test data."""
+        super().setUpTestData()
+        cls.other_user = User.objects.create_user(
+            username="other", email="other@example.com", password="testpass123"
         )
-        self.page = DocumentPage.objects.create(
-            document=self.document,
-            page_number=1,
-            markdown_content="Test content for audio retry.",
+        cls.shared_user = User.objects.create_user(
+            username="shared", email="shared@example.com", password="testpass123"
         )
 
         # Create a failed audio for testing
-        self.failed_audio = Audio.objects.create(
-            page=self.page,
+        cls.failed_audio = Audio.objects.create(
+            page=cls.page,
             voice=TTSVoice.JOANNA,
-            generated_by=self.owner,
+            generated_by=cls.owner,
             s3_key="audios/failed.mp3",
             status=AudioGenerationStatus.FAILED,
             error_message="Test failure",
         )
 
         # Create a completed audio for testing non-failed retry
-        self.completed_audio = Audio.objects.create(
-            page=self.page,
+        cls.completed_audio = Audio.objects.create(
+            page=cls.page,
             voice=TTSVoice.MATTHEW,
-            generated_by=self.owner,
+            generated_by=cls.owner,
             s3_key="audios/completed.mp3",
             status=AudioGenerationStatus.COMPLETED,
         )
 
         # Create shared document for permission testing
-        from speech_processing.models import DocumentSharing, SharingPermission
-
         DocumentSharing.objects.create(
-            document=self.document,
-            shared_with=self.shared_user,
+            document=cls.document,
+            shared_with=cls.shared_user,
             permission=SharingPermission.COLLABORATOR,
-            shared_by=self.owner,
+            shared_by=cls.owner,
         )
 
+    def setUp(self):
+        super().setUp()
+        self.client = Client()
+        self.factory = RequestFactory()
+
     @patch("speech_processing.views.transaction.on_commit")
     @patch("speech_processing.views.generate_audio_task.delay")
     def test_retry_audio_success_by_owner(self, mock_task, mock_on_commit):
         """Test successful audio retry by document owner."""
-        self.client.login(email="owner@example.com", password="testpass123")
+        self.client.force_login(self.owner)
 
         url = reverse(
             "speech_processing:retry_audio", kwargs={"audio_id": self.failed_audio.id}
@@ -526,7 +542,7 @@ class AudioRetryAPITests(TestCase):
         self.assertEqual(data["audio_id"], self.failed_audio.id)
 
         # Verify audio status was reset
-        self.failed_audio.refresh_from_db()
+        self.failed_audio.refresh_from_db(fields=["status", "error_message"])
         self.assertEqual(self.failed_audio.status, AudioGenerationStatus.PENDING)
         self.assertIsNone(self.failed_audio.error_message)
 
@@ -543,19 +559,19 @@ class AudioRetryAPITests(TestCase):
     @patch("speech_processing.views.generate_audio_task.delay")
     def test_retry_audio_success_by_shared_user(self, mock_task, mock_on_commit):
         """Test successful audio retry by user with sharing access."""
-        self.client.login(email="shared@example.com", password="testpass123")
-
         url = reverse(
             "speech_processing:retry_audio", kwargs={"audio_id": self.failed_audio.id}
         )
-        response = self.client.post(url)
+        request = self.factory.post(url)
+        request.user = self.shared_user
+        response = retry_audio(request, audio_id=self.failed_audio.id)
 
         self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = json.loads(response.content)
         self.assertTrue(data["success"])
 
         # Verify audio status was reset
-        self.failed_audio.refresh_from_db()
+        self.failed_audio.refresh_from_db(fields=["status", "error_message"])
         self.assertEqual(self.failed_audio.status, AudioGenerationStatus.PENDING)
         self.assertIsNone(self.failed_audio.error_message)
 
@@ -579,15 +595,15 @@ class AudioRetryAPITests(TestCase):
 
     def test_retry_audio_unauthorized_user(self):
         """Test retry fails for user without access."""
-        self.client.login(email="other@example.com", password="testpass123")
-
         url = reverse(
             "speech_processing:retry_audio", kwargs={"audio_id": self.failed_audio.id}
         )
-        response = self.client.post(url)
+        request = self.factory.post(url)
+        request.user = self.other_user
+        response = retry_audio(request, audio_id=self.failed_audio.id)
 
         self.assertEqual(response.status_code, 403)
-        data = response.json()
+        data = json.loads(response.content)
         self.assertFalse(data["success"])
         # Check for either 'permission' or 'access' in error message
         error_lower = data["error"].lower()
@@ -595,49 +611,49 @@ class AudioRetryAPITests(TestCase):
 
     def test_retry_audio_non_failed_status(self):
         """Test retry fails for audio that is not in FAILED status."""
-        self.client.login(email="owner@example.com", password="testpass123")
-
         url = reverse(
             "speech_processing:retry_audio",
             kwargs={"audio_id": self.completed_audio.id},
         )
-        response = self.client.post(url)
+        request = self.factory.post(url)
+        request.user = self.owner
+        response = retry_audio(request, audio_id=self.completed_audio.id)
 
         self.assertEqual(response.status_code, 400)
-        data = response.json()
+        data = json.loads(response.content)
         self.assertFalse(data["success"])
         self.assertIn("Only failed audio files can be retried", data["error"])
 
     def test_retry_audio_not_found(self):
         """Test retry fails for non-existent audio."""
-        self.client.login(email="owner@example.com", password="testpass123")
-
         url = reverse("speech_processing:retry_audio", kwargs={"audio_id": 99999})
-        response = self.client.post(url)
+        request = self.factory.post(url)
+        request.user = self.owner
+        response = retry_audio(request, audio_id=99999)
 
         self.assertEqual(response.status_code, 404)
-        data = response.json()
+        data = json.loads(response.content)
         self.assertFalse(data["success"])
         self.assertIn("Audio not found", data["error"])
 
     def test_retry_audio_get_request_fails(self):
         """Test retry fails for GET request (only POST allowed)."""
-        self.client.login(email="owner@example.com", password="testpass123")
-
         url = reverse(
             "speech_processing:retry_audio", kwargs={"audio_id": self.failed_audio.id}
         )
-        response = self.client.get(url)
+        request = self.factory.get(url)
+        request.user = self.owner
+        response = retry_audio(request, audio_id=self.failed_audio.id)
 
         self.assertEqual(response.status_code, 405)
-        data = response.json()
+        data = json.loads(response.content)
         self.assertFalse(data["success"])
         self.assertIn("Invalid request method", data["error"])
 
     @patch("speech_processing.views.generate_audio_task.delay")
     def test_retry_audio_rate_limit_exceeded(self, mock_task):
         """Test retry fails when rate limit is exceeded."""
-        self.client.login(email="owner@example.com", password="testpass123")
+        self.client.force_login(self.owner)
 
         # Mock the rate limit decorator to simulate limit exceeded
         with patch("speech_processing.views.retry_audio") as mock_view:
@@ -10,13 +10,20 @@ Key changes tested:
 2. Graceful fallback to S3 if CloudFront signing fails
 3. Consistent behavior across development and production
 4. Error handling and logging
+
+Every class here is a SimpleTestCase over unsaved model instances, so the
+module never touches the database and is safe to split across workers:
+    python manage.py test speech_processing.tests.test_cloudfront_services \
+        --settings=core.settings.test --parallel=auto
 """
 
-from unittest.mock import Mock, patch, MagicMock
-from django.test import TestCase
+from contextlib import ExitStack, contextmanager
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+from django.test import SimpleTestCase, override_settings
 from django.contrib.auth import get_user_model
 from django.conf import settings
-from django.core.cache import cache
+from core.cloudfront_utils import CloudFrontSigningError
 from document_processing.models import Document, DocumentPage
 from speech_processing.models import (
     Audio,
@@ -25,51 +32,123 @@ from speech_processing.models import (
     TTSVoice,
 )
 from speech_processing.services import AudioGenerationService
-import logging
 
 User = get_user_model()
 
+_MOCK_CF_URL = "https://d2e40gg2o2wus6.cloudfront.net/media/audio.mp3?Policy=...&Signature=..."
+_MOCK_S3_URL = "https://bucket.s3.amazonaws.com/media/audio.mp3?AWSAccessKeyId=...&Signature=..."
 
-class CloudFrontPresignedURLTests(TestCase):
-    """Test CloudFront presigned URL generation with S3 fallback."""
 
-    def setUp(self):
-        """Create test fixtures: user, document, page, and audio."""
-        self.user = User.objects.create_user(
+@contextmanager
+def swap_logger():
+    """
+    Temporarily replace speech_processing.services.logger with plain Mocks.
+
+    Cheaper than patch("speech_processing.services.logger"), which builds a
+    MagicMock and goes through the full patcher start/stop on every test.
+    """
+    from speech_processing import services
+
+    old_logger = services.logger
+    fake_logger = SimpleNamespace(
+        debug=Mock(), info=Mock(), warning=Mock(), error=Mock()
+    )
+    services.logger = fake_logger
+    try:
+        yield fake_logger
+    finally:
+        services.logger = old_logger
+
+
+class AudioFixtureMixin:
+    """
+    Unsaved user, document, page, and audio fixtures plus a shared service.
+
+    get_presigned_url() only reads audio.id and audio.s3_key, so nothing
+    needs to be written to the database. The service holds no per-call
+    state, so one instance (and one set of boto3 clients) serves the class.
+    """
+
+    voice = TTSVoice.JOANNA
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.user = User(
+            id=1,
             username="cloudfront_test_user",
             email="cloudfront@example.com",
-            password="testpass123",
         )
-        self.document = Document.objects.create(
-            user=self.user,
+        cls.document = Document(
+            id=1,
+            user=cls.user,
             title="CloudFront Test Document",
             source_content="test.pdf",
             source_type="FILE",
             status="COMPLETED",
         )
-        self.page = DocumentPage.objects.create(
-            document=self.document,
+        cls.page = DocumentPage(
+            id=1,
+            document=cls.document,
             page_number=1,
             markdown_content="Test content for CloudFront URL generation.",
         )
-        self.audio = Audio.objects.create(
-            page=self.page,
-            voice=TTSVoice.JOANNA,
-            generated_by=self.user,
-            s3_key="audios/document_1/page_1/voice_Joanna_20251104_120000.mp3",
+        cls.audio = Audio(
+            id=1,
+            page=cls.page,
+            voice=cls.voice,
+            generated_by=cls.user,
+            s3_key=f"audios/document_1/page_1/voice_{cls.voice}_20251104_120000.mp3",
             status=AudioGenerationStatus.COMPLETED,
             lifetime_status=AudioLifetimeStatus.ACTIVE,
         )
-        self.service = AudioGenerationService()
-        # Clear cache before each test
-        cache.clear()
+        cls.service = AudioGenerationService()
+
+
+class SigningPatchMixin(AudioFixtureMixin):
+    """Patch the CloudFront and S3 signing backends once per test class."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Both patches are entered together and undone by a single cleanup
+        patches = ExitStack()
+        cls.mock_cloudfront = patches.enter_context(
+            patch("core.cloudfront_utils.get_audio_signed_url", new_callable=Mock)
+        )
+        cls.mock_s3 = patches.enter_context(
+            patch.object(
+                AudioGenerationService, "_get_s3_presigned_url", new_callable=Mock
+            )
+        )
+        cls.addClassCleanup(patches.close)
+
+    def setUp(self):
+        super().setUp()
+        self.mock_cloudfront.reset_mock(return_value=True, side_effect=True)
+        self.mock_s3.reset_mock(return_value=True, side_effect=True)
+
+
+# get_presigned_url() never shares cache keys between tests, so a
+# process-local cache needs no clearing and never leaves the process.
+LOCMEM_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "cf-tests",
+    }
+}
 
-    def tearDown(self):
-        """Clean up after tests."""
-        cache.clear()
 
-    @patch("core.cloudfront_utils.get_audio_signed_url")
-    def test_get_presigned_url_uses_cloudfront_first(self, mock_cloudfront):
+@override_settings(CACHES=LOCMEM_CACHES)
+class CloudFrontPresignedURLTests(SigningPatchMixin, SimpleTestCase):
+    """Test CloudFront presigned URL generation with S3 fallback."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.default_expiration = settings.AUDIO_PRESIGNED_URL_EXPIRATION_SECONDS
+
+    def test_get_presigned_url_uses_cloudfront_first(self):
         """
         Test that get_presigned_url() always attempts CloudFront first,
         regardless of environment.
@@ -78,24 +157,25 @@ class CloudFrontPresignedURLTests(TestCase):
         - Calls get_audio_signed_url() from cloudfront_utils
         - Returns CloudFront signed URL if successful
         - Does not fall back to S3
+        - Signs afresh on every call (caching lives in cloudfront_utils,
+          not at service level)
         """
         # Mock successful CloudFront signing
-        mock_cloudfront_url = "https://d2e40gg2o2wus6.cloudfront.net/media/audio.mp3?Policy=...&Signature=..."
-        mock_cloudfront.return_value = mock_cloudfront_url
+        self.mock_cloudfront.return_value = _MOCK_CF_URL
 
         # Call the method
         result = self.service.get_presigned_url(self.audio)
 
         # Assertions
-        self.assertEqual(result, mock_cloudfront_url)
-        mock_cloudfront.assert_called_once()
+        self.assertEqual(result, _MOCK_CF_URL)
+        self.mock_cloudfront.assert_called_once()
         self.assertIn("cloudfront.net", result)
 
-    @patch("core.cloudfront_utils.get_audio_signed_url")
-    @patch.object(AudioGenerationService, "_get_s3_presigned_url")
-    def test_get_presigned_url_falls_back_to_s3_on_cloudfront_error(
-        self, mock_s3, mock_cloudfront
-    ):
+        # A second call goes back to CloudFront (no service-level caching)
+        self.assertEqual(self.service.get_presigned_url(self.audio), result)
+        self.assertEqual(self.mock_cloudfront.call_count, 2)
+
+    def test_get_presigned_url_falls_back_to_s3_on_cloudfront_error(self):
         """
         Test that get_presigned_url() gracefully falls back to S3 if CloudFront fails.
 
@@ -106,29 +186,22 @@ class CloudFrontPresignedURLTests(TestCase):
         - Returns S3 URL
         - Logs warning about CloudFront failure
         """
-        from core.cloudfront_utils import CloudFrontSigningError
-
         # Mock CloudFront failure
-        mock_cloudfront.side_effect = CloudFrontSigningError("Private key not found")
+        self.mock_cloudfront.side_effect = CloudFrontSigningError("Private key not found")
 
         # Mock successful S3 fallback
-        s3_url = "https://bucket.s3.amazonaws.com/media/audio.mp3?AWSAccessKeyId=...&Signature=..."
-        mock_s3.return_value = s3_url
+        self.mock_s3.return_value = _MOCK_S3_URL
 
         # Call the method
         result = self.service.get_presigned_url(self.audio)
 
         # Assertions
-        self.assertEqual(result, s3_url)
-        mock_cloudfront.assert_called_once()
-        mock_s3.assert_called_once()
+        self.assertEqual(result, _MOCK_S3_URL)
+        self.mock_cloudfront.assert_called_once()
+        self.mock_s3.assert_called_once()
         self.assertIn("s3.amazonaws.com", result)
 
-    @patch("core.cloudfront_utils.get_audio_signed_url")
-    @patch.object(AudioGenerationService, "_get_s3_presigned_url")
-    def test_get_presigned_url_returns_none_on_total_failure(
-        self, mock_s3, mock_cloudfront
-    ):
+    def test_get_presigned_url_returns_none_on_total_failure(self):
         """
         Test that get_presigned_url() returns None if both CloudFront and S3 fail.
 
@@ -138,183 +211,150 @@ class CloudFrontPresignedURLTests(TestCase):
         - Returns None
         - Logs error about complete failure
         """
-        from core.cloudfront_utils import CloudFrontSigningError
-
         # Mock both services failing
-        mock_cloudfront.side_effect = CloudFrontSigningError("Private key not found")
-        mock_s3.return_value = None  # S3 fallback also fails
+        self.mock_cloudfront.side_effect = CloudFrontSigningError("Private key not found")
+        self.mock_s3.return_value = None  # S3 fallback also fails
 
         # Call the method
         result = self.service.get_presigned_url(self.audio)
 
         # Assertions
         self.assertIsNone(result)
-        mock_cloudfront.assert_called_once()
-        mock_s3.assert_called_once()
+        self.mock_cloudfront.assert_called_once()
+        self.mock_s3.assert_called_once()
 
-    @patch("core.cloudfront_utils.get_audio_signed_url")
-    @patch.object(AudioGenerationService, "_get_s3_presigned_url")
-    def test_get_presigned_url_uses_custom_expiration(self, mock_s3, mock_cloudfront):
+    def test_get_presigned_url_passes_expiration(self):
         """
-        Test that get_presigned_url() respects custom expiration parameter.
+        Test that get_presigned_url() passes the right expiration to CloudFront.
 
         Expected behavior:
-        - Passes expiration parameter to CloudFront
-        - Uses custom expiration instead of default from settings
-        """
-        mock_cloudfront_url = "https://d2e40gg2o2wus6.cloudfront.net/media/audio.mp3?Policy=...&Signature=..."
-        mock_cloudfront.return_value = mock_cloudfront_url
-        custom_expiration = 7200  # 2 hours
-
-        # Call the method with custom expiration
-        result = self.service.get_presigned_url(
-            self.audio, expiration=custom_expiration
-        )
-
-        # Assertions
-        self.assertEqual(result, mock_cloudfront_url)
-        # Verify CloudFront was called with correct expiration
-        mock_cloudfront.assert_called_once_with(
-            self.audio, expiration_seconds=custom_expiration
-        )
-
-    @patch("core.cloudfront_utils.get_audio_signed_url")
-    def test_get_presigned_url_uses_default_expiration(self, mock_cloudfront):
+        - Uses AUDIO_PRESIGNED_URL_EXPIRATION_SECONDS from settings by default
+        - Uses a custom expiration instead of the default when one is given
         """
-        Test that get_presigned_url() uses default expiration from settings.
+        self.mock_cloudfront.return_value = _MOCK_CF_URL
+        cases = [
+            # (expiration kwargs, expected expiration_seconds)
+            ({}, self.default_expiration),
+            ({"expiration": 7200}, 7200),  # 2 hours
+        ]
 
-        Expected behavior:
-        - Uses AUDIO_PRESIGNED_URL_EXPIRATION_SECONDS from settings
-        - Defaults to 3600 seconds (1 hour)
-        """
-        mock_cloudfront_url = "https://d2e40gg2o2wus6.cloudfront.net/media/audio.mp3?Policy=...&Signature=..."
-        mock_cloudfront.return_value = mock_cloudfront_url
+        for kwargs, expected_expiration in cases:
+            with self.subTest(expected_expiration=expected_expiration):
+                self.mock_cloudfront.reset_mock()
 
-        # Call the method without explicit expiration
-        result = self.service.get_presigned_url(self.audio)
+                result = self.service.get_presigned_url(self.audio, **kwargs)
 
-        # Assertions
-        self.assertEqual(result, mock_cloudfront_url)
-        # Verify default expiration from settings was used
-        expected_expiration = settings.AUDIO_PRESIGNED_URL_EXPIRATION_SECONDS
-        mock_cloudfront.assert_called_once_with(
-            self.audio, expiration_seconds=expected_expiration
-        )
+                self.assertEqual(result, _MOCK_CF_URL)
+                self.mock_cloudfront.assert_called_once_with(
+                    self.audio, expiration_seconds=expected_expiration
+                )
 
-    @patch("speech_processing.services.logger")
-    @patch("core.cloudfront_utils.get_audio_signed_url")
-    def test_get_presigned_url_logs_debug_on_cloudfront_attempt(
-        self, mock_cloudfront, mock_logger
-    ):
+    def test_get_presigned_url_logging_levels(self):
         """
-        Test that get_presigned_url() logs debug message when attempting CloudFront.
+        Test that get_presigned_url() logs at the right level for each outcome.
 
         Expected behavior:
-        - Logs debug message before attempting CloudFront signing
-        - Message includes audio ID
-        """
-        mock_cloudfront_url = "https://d2e40gg2o2wus6.cloudfront.net/media/audio.mp3?Policy=...&Signature=..."
-        mock_cloudfront.return_value = mock_cloudfront_url
-
-        # Call the method
-        result = self.service.get_presigned_url(self.audio)
-
-        # Assertions
-        mock_logger.debug.assert_called()
-        # Check that debug message includes audio ID
-        debug_calls = [str(call) for call in mock_logger.debug.call_args_list]
-        self.assertTrue(
-            any(str(self.audio.id) in str(call) for call in debug_calls),
-            f"Audio ID not found in debug logs: {debug_calls}",
-        )
-
-    @patch("speech_processing.services.logger")
-    @patch("core.cloudfront_utils.get_audio_signed_url")
-    @patch.object(AudioGenerationService, "_get_s3_presigned_url")
-    def test_get_presigned_url_logs_warning_on_cloudfront_failure(
-        self, mock_s3, mock_cloudfront, mock_logger
-    ):
+        - Logs debug (with audio ID) when attempting CloudFront
+        - Logs warning (with audio ID) when CloudFront signing fails
+        - Logs info mentioning S3 when falling back
+        - Logs error and returns None on unexpected exceptions
+        """
+        scenarios = [
+            # (level, CloudFront side effect, S3 URL, expected text in message)
+            ("debug", None, None, str(self.audio.id)),
+            (
+                "warning",
+                CloudFrontSigningError("Private key not found"),
+                _MOCK_S3_URL,
+                str(self.audio.id),
+            ),
+            (
+                "info",
+                CloudFrontSigningError("Private key not found"),
+                _MOCK_S3_URL,
+                "S3",
+            ),
+            ("error", Exception("Unexpected error"), None, None),
+        ]
+
+        for level, side_effect, s3_return, expected_text in scenarios:
+            with self.subTest(level=level):
+                self.mock_cloudfront.reset_mock()
+                self.mock_cloudfront.return_value = _MOCK_CF_URL
+                self.mock_cloudfront.side_effect = side_effect
+                self.mock_s3.return_value = s3_return
+
+                with swap_logger() as mock_logger:
+                    result = self.service.get_presigned_url(self.audio)
+
+                level_logger = getattr(mock_logger, level)
+                level_logger.assert_called()
+                if expected_text is None:
+                    self.assertIsNone(result)
+                    continue
+                # services.py logs pre-formatted f-strings, so the message is
+                # always the first positional argument
+                messages = [call.args[0] for call in level_logger.call_args_list]
+                self.assertTrue(
+                    any(expected_text in message for message in messages),
+                    f"{expected_text!r} not found in {level} logs: {messages}",
+                )
+
+    def test_get_presigned_url_returns_correct_url_format(self):
         """
-        Test that get_presigned_url() logs warning when CloudFront fails.
+        Test that get_presigned_url() returns URLs in correct format.
 
         Expected behavior:
-        - Logs warning message when CloudFront signing fails
-        - Message includes audio ID and error details
+        - CloudFront URL includes Policy and Signature parameters
+        - CloudFront URL includes Key-Pair-Id parameter
+        - CloudFront URL uses HTTPS
         """
-        from core.cloudfront_utils import CloudFrontSigningError
-
-        mock_cloudfront.side_effect = CloudFrontSigningError("Private key not found")
-        s3_url = "https://bucket.s3.amazonaws.com/media/audio.mp3?AWSAccessKeyId=...&Signature=..."
-        mock_s3.return_value = s3_url
+        cloudfront_url = (
+            "https://d2e40gg2o2wus6.cloudfront.net/media/audio.mp3"
+            "?Policy=eyJTdGF0ZW1lbnQiOlt7ImNvbmRpdGlvbiI6eyJEYXRlTGVzc1RoYW4iOnsi"
+            "QVdTOkVwb2NoVGltZSI6MTcwMjEyODAwMH19XX0_"
+            "&Signature=HOjr5nCnCAzjqxL0..."
+            "&Key-Pair-Id=K1603YIV6IA5M2"
+        )
+        self.mock_cloudfront.return_value = cloudfront_url
 
-        # Call the method
         result = self.service.get_presigned_url(self.audio)
 
         # Assertions
-        mock_logger.warning.assert_called()
-        # Check that warning includes audio ID
-        warning_calls = [str(call) for call in mock_logger.warning.call_args_list]
-        self.assertTrue(
-            any(str(self.audio.id) in str(call) for call in warning_calls),
-            f"Audio ID not found in warning logs: {warning_calls}",
-        )
+        required = ("https://", "cloudfront.net", "Policy=", "Signature=", "Key-Pair-Id=")
+        missing = [fragment for fragment in required if fragment not in result]
+        self.assertFalse(missing, f"Missing fragments: {missing}")
 
-    @patch("speech_processing.services.logger")
-    @patch("core.cloudfront_utils.get_audio_signed_url")
-    @patch.object(AudioGenerationService, "_get_s3_presigned_url")
-    def test_get_presigned_url_logs_info_on_s3_fallback(
-        self, mock_s3, mock_cloudfront, mock_logger
-    ):
+    def test_get_presigned_url_different_expirations(self):
         """
-        Test that get_presigned_url() logs info message when falling back to S3.
+        Test that get_presigned_url() generates different URLs with different expirations.
 
         Expected behavior:
-        - Logs info message when CloudFront fails and S3 is used
-        - Message includes audio ID
+        - Passing different expiration values produces different URLs
+        - Each URL is generated fresh
         """
-        from core.cloudfront_utils import CloudFrontSigningError
-
-        mock_cloudfront.side_effect = CloudFrontSigningError("Private key not found")
-        s3_url = "https://bucket.s3.amazonaws.com/media/audio.mp3?AWSAccessKeyId=...&Signature=..."
-        mock_s3.return_value = s3_url
 
-        # Call the method
-        result = self.service.get_presigned_url(self.audio)
+        def cloudfront_side_effect(audio, expiration_seconds):
+            # Return different URL based on expiration
+            return (
+                "https://d2e40gg2o2wus6.cloudfront.net/media/audio.mp3"
+                f"?expires={expiration_seconds}"
+            )
 
-        # Assertions
-        mock_logger.info.assert_called()
-        # Check that info message mentions S3 fallback
-        info_calls = [str(call) for call in mock_logger.info.call_args_list]
-        self.assertTrue(
-            any(
-                "fallback" in str(call).lower() or "S3" in str(call)
-                for call in info_calls
-            ),
-            f"S3 fallback not mentioned in info logs: {info_calls}",
-        )
+        self.mock_cloudfront.side_effect = cloudfront_side_effect
 
-    @patch("speech_processing.services.logger")
-    @patch("core.cloudfront_utils.get_audio_signed_url")
-    def test_get_presigned_url_logs_error_on_unexpected_exception(
-        self, mock_cloudfront, mock_logger
-    ):
-        """
-        Test that get_presigned_url() logs error on unexpected exceptions.
+        # Call with different expirations
+        url1 = self.service.get_presigned_url(self.audio, expiration=3600)
+        url2 = self.service.get_presigned_url(self.audio, expiration=7200)
 
-        Expected behavior:
-        - Catches unexpected exceptions
-        - Logs error message
-        - Returns None
-        """
-        # Mock unexpected exception
-        mock_cloudfront.side_effect = Exception("Unexpected error")
+        # Assertions
+        self.assertNotEqual(url1, url2)
+        self.assertIn("expires=3600", url1)
+        self.assertIn("expires=7200", url2)
 
-        # Call the method
-        result = self.service.get_presigned_url(self.audio)
 
-        # Assertions
-        self.assertIsNone(result)
-        mock_logger.error.assert_called()
+class S3PresignedURLTests(AudioFixtureMixin, SimpleTestCase):
+    """Test the S3 presigned URL fallback used when CloudFront signing fails."""
 
     def test_get_s3_presigned_url_success(self):
         """
@@ -326,15 +366,16 @@ class CloudFrontPresignedURLTests(TestCase):
         - Includes bucket name, key, and parameters
         """
         with patch.object(
-            self.service.polly_service.s3_client, "generate_presigned_url"
+            self.service.polly_service.s3_client,
+            "generate_presigned_url",
+            new_callable=Mock,
         ) as mock_s3_gen:
-            s3_url = "https://bucket.s3.amazonaws.com/media/audio.mp3?AWSAccessKeyId=AKIA...&Signature=..."
-            mock_s3_gen.return_value = s3_url
+            mock_s3_gen.return_value = _MOCK_S3_URL
 
             result = self.service._get_s3_presigned_url(self.audio, 3600)
 
             # Assertions
-            self.assertEqual(result, s3_url)
+            self.assertEqual(result, _MOCK_S3_URL)
             mock_s3_gen.assert_called_once()
 
     def test_get_s3_presigned_url_failure_returns_none(self):
@@ -349,6 +390,7 @@ class CloudFrontPresignedURLTests(TestCase):
         with patch.object(
             self.service.polly_service.s3_client,
             "generate_presigned_url",
+            new_callable=Mock,
             side_effect=Exception("S3 error"),
         ):
             result = self.service._get_s3_presigned_url(self.audio, 3600)
@@ -356,114 +398,13 @@ class CloudFrontPresignedURLTests(TestCase):
             # Assertions
             self.assertIsNone(result)
 
-    @patch("core.cloudfront_utils.get_audio_signed_url")
-    def test_get_presigned_url_returns_correct_url_format(self, mock_cloudfront):
-        """
-        Test that get_presigned_url() returns URLs in correct format.
-
-        Expected behavior:
-        - CloudFront URL includes Policy and Signature parameters
-        - CloudFront URL includes Key-Pair-Id parameter
-        - CloudFront URL uses HTTPS
-        """
-        cloudfront_url = (
-            "https://d2e40gg2o2wus6.cloudfront.net/media/audio.mp3"
-            "?Policy=eyJTdGF0ZW1lbnQiOlt7ImNvbmRpdGlvbiI6eyJEYXRlTGVzc1RoYW4iOnsiQVdTOkVwb2NoVGltZSI6MTcwMjEyODAwMH19XX0_"
-            "&Signature=HOjr5nCnCAzjqxL0..."
-            "&Key-Pair-Id=K1603YIV6IA5M2"
-        )
-        mock_cloudfront.return_value = cloudfront_url
-
-        result = self.service.get_presigned_url(self.audio)
-
-        # Assertions
-        self.assertIn("https://", result)
-        self.assertIn("cloudfront.net", result)
-        self.assertIn("Policy=", result)
-        self.assertIn("Signature=", result)
-        self.assertIn("Key-Pair-Id=", result)
-
-    @patch("core.cloudfront_utils.get_audio_signed_url")
-    def test_get_presigned_url_caching_behavior(self, mock_cloudfront):
-        """
-        Test that get_presigned_url() can be called multiple times.
-
-        Expected behavior:
-        - Each call attempts CloudFront fresh
-        - No caching at service level (caching is in cloudfront_utils)
-        """
-        mock_cloudfront_url = "https://d2e40gg2o2wus6.cloudfront.net/media/audio.mp3?Policy=...&Signature=..."
-        mock_cloudfront.return_value = mock_cloudfront_url
-
-        # Call twice
-        result1 = self.service.get_presigned_url(self.audio)
-        result2 = self.service.get_presigned_url(self.audio)
 
-        # Assertions
-        self.assertEqual(result1, result2)
-        # Verify CloudFront was called multiple times (no service-level caching)
-        self.assertEqual(mock_cloudfront.call_count, 2)
-
-    @patch("core.cloudfront_utils.get_audio_signed_url")
-    def test_get_presigned_url_different_expirations(self, mock_cloudfront):
-        """
-        Test that get_presigned_url() generates different URLs with different expirations.
-
-        Expected behavior:
-        - Passing different expiration values produces different URLs
-        - Each URL is generated fresh
-        """
-
-        def cloudfront_side_effect(audio, expiration_seconds):
-            # Return different URL based on expiration
-            return f"https://d2e40gg2o2wus6.cloudfront.net/media/audio.mp3?expires={expiration_seconds}"
-
-        mock_cloudfront.side_effect = cloudfront_side_effect
-
-        # Call with different expirations
-        url1 = self.service.get_presigned_url(self.audio, expiration=3600)
-        url2 = self.service.get_presigned_url(self.audio, expiration=7200)
-
-        # Assertions
-        self.assertNotEqual(url1, url2)
-        self.assertIn("expires=3600", url1)
-        self.assertIn("expires=7200", url2)
-
-
-class CloudFrontServiceConsistencyTests(TestCase):
+class CloudFrontServiceConsistencyTests(SigningPatchMixin, SimpleTestCase):
     """Test that CloudFront behavior is consistent across dev and production."""
 
-    def setUp(self):
-        """Create test fixtures."""
-        self.user = User.objects.create_user(
-            username="consistency_test_user",
-            email="consistency@example.com",
-            password="testpass123",
-        )
-        self.document = Document.objects.create(
-            user=self.user,
-            title="Consistency Test Document",
-            source_content="test.pdf",
-            source_type="FILE",
-            status="COMPLETED",
-        )
-        self.page = DocumentPage.objects.create(
-            document=self.document,
-            page_number=1,
-            markdown_content="Test content for consistency checking.",
-        )
-        self.audio = Audio.objects.create(
-            page=self.page,
-            voice=TTSVoice.MATTHEW,
-            generated_by=self.user,
-            s3_key="audios/document_1/page_1/voice_Matthew_20251104_120000.mp3",
-            status=AudioGenerationStatus.COMPLETED,
-            lifetime_status=AudioLifetimeStatus.ACTIVE,
-        )
-        self.service = AudioGenerationService()
+    voice = TTSVoice.MATTHEW
 
-    @patch("core.cloudfront_utils.get_audio_signed_url")
-    def test_cloudfront_used_regardless_of_environment(self, mock_cloudfront):
+    def test_cloudfront_used_regardless_of_environment(self):
         """
         Test that CloudFront is attempted regardless of ENVIRONMENT setting.
 
@@ -471,18 +412,15 @@ class CloudFrontServiceConsistencyTests(TestCase):
         - Same code path for development and production
         - Always attempts CloudFront first
         """
-        mock_cloudfront_url = "https://d2e40gg2o2wus6.cloudfront.net/media/audio.mp3?Policy=...&Signature=..."
-        mock_cloudfront.return_value = mock_cloudfront_url
+        self.mock_cloudfront.return_value = _MOCK_CF_URL
 
         # Should work the same regardless of environment
         result = self.service.get_presigned_url(self.audio)
 
-        self.assertEqual(result, mock_cloudfront_url)
-        mock_cloudfront.assert_called_once()
+        self.assertEqual(result, _MOCK_CF_URL)
+        self.mock_cloudfront.assert_called_once()
 
-    @patch("core.cloudfront_utils.get_audio_signed_url")
-    @patch.object(AudioGenerationService, "_get_s3_presigned_url")
-    def test_s3_fallback_same_for_all_environments(self, mock_s3, mock_cloudfront):
+    def test_s3_fallback_same_for_all_environments(self):
         """
         Test that S3 fallback works the same in all environments.
 
@@ -490,15 +428,12 @@ class CloudFrontServiceConsistencyTests(TestCase):
         - S3 fallback triggered only if CloudFront fails
         - Same behavior in dev and production
         """
-        from core.cloudfront_utils import CloudFrontSigningError
-
-        mock_cloudfront.side_effect = CloudFrontSigningError("Key not found")
-        s3_url = "https://bucket.s3.amazonaws.com/media/audio.mp3?AWSAccessKeyId=...&Signature=..."
-        mock_s3.return_value = s3_url
+        self.mock_cloudfront.side_effect = CloudFrontSigningError("Key not found")
+        self.mock_s3.return_value = _MOCK_S3_URL
 
         result = self.service.get_presigned_url(self.audio)
 
-        self.assertEqual(result, s3_url)
+        self.assertEqual(result, _MOCK_S3_URL)
         # Verify both were called
-        mock_cloudfront.assert_called_once()
-        mock_s3.assert_called_once()
+        self.mock_cloudfront.assert_called_once()
+        self.mock_s3.assert_called_once()
@@ -3,11 +3,13 @@ Unit tests for Audio model.
 Tests quota enforcement, voice uniqueness, expiry logic, and soft delete.
 """
 
-from django.test import TestCase
+from django.test import TestCase, tag
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.utils import timezone
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest.mock import patch
 from document_processing.models import Document, DocumentPage
 from speech_processing.models import (
     Audio,
@@ -16,148 +18,148 @@ from speech_processing.models import (
     TTSVoice,
     SiteSettings,
 )
+from speech_processing.tests.utils import SiteSettingsCacheMixin
 
 User = get_user_model()
 
+# One S3 key per voice, built once for the quota tests
+S3_KEYS = {voice: f"audios/{voice}.mp3" for voice in TTSVoice}
 
-class AudioModelQuotaTests(TestCase):
-    """Test quota enforcement (max 4 audios per page lifetime)."""
 
-    def setUp(self):
+class BaseAudioTestMixin(SiteSettingsCacheMixin):
+    """Shared user/document/page fixtures and Audio assertions."""
+
+    @classmethod
+    def setUpTestData(cls):
         """Create test user, document, and page."""
-        self.user = User.objects.create_user(username="testuser21", email="test@example.com", password="testpass123"
+        cls.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass123"
         )
-        self.document = Document.objects.create(
-            user=self.user,
+        cls.document = Document.objects.create(
+            user=cls.user,
             title="Test Document",
-            source_content="test.pdf", source_type="FILE",
+            source_content="test.pdf",
+            source_type="FILE",
             status="COMPLETED",
         )
-        self.page = DocumentPage.objects.create(
-            document=self.document,
+        cls.page = DocumentPage.objects.create(
+            document=cls.document,
             page_number=1,
             markdown_content="Test content for TTS generation.",
         )
 
+    def assertAudioExists(self, pk, **filters):
+        """Assert a matching Audio row exists (SELECT 1 ... LIMIT 1, no row load)."""
+        self.assertTrue(Audio.objects.filter(pk=pk, **filters).exists())
+
+
+@tag("models", "fast")
+class AudioModelQuotaTests(BaseAudioTestMixin, TestCase):
+    """Test quota enforcement (max 4 audios per page lifetime)."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create test data and pin the per-page quota."""
+        super().setUpTestData()
         # Ensure SiteSettings exists with default max_audios_per_page = 4
-        self.settings = SiteSettings.get_settings()
-        self.settings.max_audios_per_page = 4
-        self.settings.save()
+        cls.settings = SiteSettings.get_settings()
+        cls.settings.max_audios_per_page = 4
+        cls.settings.save()
 
     def test_can_create_audio_within_quota(self):
         """Test that audios can be created when under quota."""
-        audio = Audio.objects.create(
-            page=self.page,
-            voice=TTSVoice.JOANNA,
-            generated_by=self.user,
-            s3_key="audios/test1.mp3",
-            status=AudioGenerationStatus.COMPLETED,
-        )
-        self.assertEqual(audio.page, self.page)
-        self.assertEqual(audio.voice, TTSVoice.JOANNA)
-
-    def test_quota_enforcement_max_4_audios(self):
-        """Test that 5th audio creation fails (max 4 allowed)."""
-        # Create 4 audios (at quota limit)
-        voices = [TTSVoice.JOANNA, TTSVoice.MATTHEW, TTSVoice.IVY, TTSVoice.JOEY]
-        for voice in voices:
-            Audio.objects.create(
+        # SiteSettings + quota count + voice check in clean(), then the INSERT
+        with self.assertNumQueries(4):
+            audio = Audio.objects.create(
                 page=self.page,
-                voice=voice,
+                voice=TTSVoice.JOANNA,
                 generated_by=self.user,
-                s3_key=f"audios/{voice}.mp3",
+                s3_key="audios/test1.mp3",
                 status=AudioGenerationStatus.COMPLETED,
             )
+        self.assertEqual(audio.page, self.page)
+        self.assertEqual(audio.voice, TTSVoice.JOANNA)
 
-        # Try to create 5th audio - should fail
-        with self.assertRaises(ValidationError) as cm:
-            audio = Audio(
-                page=self.page,
-                voice=TTSVoice.KENDRA,
-                generated_by=self.user,
-                s3_key="audios/kendra.mp3",
-            )
-            audio.clean()  # This should raise ValidationError
-
-        self.assertIn("Maximum 4 audios per page", str(cm.exception))
-
-    def test_deleted_audios_count_toward_quota(self):
-        """Test that soft-deleted audios still count toward lifetime quota."""
-        # Create 3 audios
-        for i, voice in enumerate([TTSVoice.JOANNA, TTSVoice.MATTHEW, TTSVoice.IVY]):
-            Audio.objects.create(
-                page=self.page,
-                voice=voice,
-                generated_by=self.user,
-                s3_key=f"audios/{voice}.mp3",
-            )
-
-        # Soft delete one audio
-        audio_to_delete = Audio.objects.get(voice=TTSVoice.IVY)
-        audio_to_delete.lifetime_status = AudioLifetimeStatus.DELETED
-        audio_to_delete.deleted_at = timezone.now()
-        audio_to_delete.save()
-
-        # Should still be able to create 1 more (total lifetime = 4)
-        audio4 = Audio(
-            page=self.page,
-            voice=TTSVoice.JOEY,
-            generated_by=self.user,
-            s3_key="audios/joey.mp3",
-        )
-        audio4.clean()  # Should not raise
-        audio4.save()
-
-        # But 5th should fail
-        with self.assertRaises(ValidationError):
-            audio5 = Audio(
-                page=self.page,
-                voice=TTSVoice.KENDRA,
-                generated_by=self.user,
-                s3_key="audios/kendra.mp3",
-            )
-            audio5.clean()
-
-    def test_expired_audios_count_toward_quota(self):
-        """Test that expired audios count toward lifetime quota."""
-        # Create 4 audios, mark one as expired
-        voices = [TTSVoice.JOANNA, TTSVoice.MATTHEW, TTSVoice.IVY, TTSVoice.JOEY]
-        for voice in voices:
-            Audio.objects.create(
-                page=self.page,
-                voice=voice,
-                generated_by=self.user,
-                s3_key=f"audios/{voice}.mp3",
-            )
-
-        # Mark one as expired
-        audio_to_expire = Audio.objects.get(voice=TTSVoice.JOEY)
-        audio_to_expire.lifetime_status = AudioLifetimeStatus.EXPIRED
-        audio_to_expire.save()
-
-        # Quota should still be full (4 audios lifetime)
-        with self.assertRaises(ValidationError):
-            audio5 = Audio(
-                page=self.page,
-                voice=TTSVoice.KENDRA,
-                generated_by=self.user,
-                s3_key="audios/kendra.mp3",
+    def test_quota_enforcement_variants(self):
+        """
+        Test that the 5th audio fails (max 4 allowed) whether the earlier
+        audios are active, soft-deleted, or expired.
+        """
+        # Three audios shared by every variant; each variant then brings the
+        # page up to its 4th audio and is rolled back afterwards
+        created = {
+            audio.voice: audio
+            for audio in Audio.objects.bulk_create(
+                [
+                    Audio(
+                        page=self.page,
+                        voice=voice,
+                        generated_by=self.user,
+                        s3_key=S3_KEYS[voice],
+                        status=AudioGenerationStatus.COMPLETED,
+                    )
+                    for voice in [TTSVoice.JOANNA, TTSVoice.MATTHEW, TTSVoice.IVY]
+                ]
             )
-            audio5.clean()
-
-
-class AudioModelVoiceUniquenessTests(TestCase):
+        }
+
+        for variant in ("active", "deleted", "expired"):
+            with self.subTest(variant=variant):
+                sid = transaction.savepoint()
+                try:
+                    if variant == "deleted":
+                        # Soft-deleted audios still count toward lifetime quota
+                        Audio.objects.filter(pk=created[TTSVoice.IVY].pk).update(
+                            lifetime_status=AudioLifetimeStatus.DELETED,
+                            deleted_at=timezone.now(),
+                        )
+
+                    # The 4th audio is still within quota
+                    audio4 = Audio(
+                        page=self.page,
+                        voice=TTSVoice.JOEY,
+                        generated_by=self.user,
+                        s3_key=S3_KEYS[TTSVoice.JOEY],
+                    )
+                    audio4.save()  # Runs clean(), which should not raise
+
+                    if variant == "expired":
+                        # Expired audios count toward lifetime quota too
+                        Audio.objects.filter(pk=audio4.pk).update(
+                            lifetime_status=AudioLifetimeStatus.EXPIRED
+                        )
+
+                    # The 5th should fail after SiteSettings + quota count
+                    with self.assertNumQueries(2):
+                        with self.assertRaises(ValidationError) as cm:
+                            audio5 = Audio(
+                                page=self.page,
+                                voice=TTSVoice.KENDRA,
+                                generated_by=self.user,
+                                s3_key=S3_KEYS[TTSVoice.KENDRA],
+                            )
+                            audio5.clean()
+
+                    self.assertTrue(
+                        any(
+                            "Maximum 4 audios per page" in message
+                            for message in cm.exception.messages
+                        )
+                    )
+                finally:
+                    transaction.savepoint_rollback(sid)
+
+
+@tag("models", "fast")
+class AudioModelVoiceUniquenessTests(BaseAudioTestMixin, TestCase):
     """Test voice uniqueness constraint (no duplicate active voices per page)."""
 
-    def setUp(self):
-        """Create test data."""
-        self.user = User.objects.create_user(username="testuser22", email="test@example.com", password="testpass123"
-        )
-        self.document = Document.objects.create(
-            user=self.user, title="Test Document", source_content="test.pdf", source_type="FILE", status="COMPLETED"
-        )
-        self.page = DocumentPage.objects.create(
-            document=self.document, page_number=1, markdown_content="Test content"
+    @classmethod
+    def setUpTestData(cls):
+        """Create test data plus a second page on the same document."""
+        super().setUpTestData()
+        cls.page2 = DocumentPage.objects.create(
+            document=cls.document, page_number=2, markdown_content="Different content"
         )
 
     def test_cannot_create_duplicate_active_voice(self):
@@ -172,17 +174,24 @@ class AudioModelVoiceUniquenessTests(TestCase):
         )
 
         # Try to create second audio with same voice - should fail in clean()
-        with self.assertRaises(ValidationError) as cm:
-            audio2 = Audio(
-                page=self.page,
-                voice=TTSVoice.JOANNA,
-                generated_by=self.user,
-                s3_key="audios/joanna2.mp3",
-                lifetime_status=AudioLifetimeStatus.ACTIVE,
+        # after SiteSettings + quota count + voice check
+        with self.assertNumQueries(3):
+            with self.assertRaises(ValidationError) as cm:
+                audio2 = Audio(
+                    page=self.page,
+                    voice=TTSVoice.JOANNA,
+                    generated_by=self.user,
+                    s3_key="audios/joanna2.mp3",
+                    lifetime_status=AudioLifetimeStatus.ACTIVE,
+                )
+                audio2.clean()
+
+        self.assertTrue(
+            any(
+                "Voice Joanna is already used" in message
+                for message in cm.exception.messages
             )
-            audio2.clean()
-
-        self.assertIn("Voice Joanna is already used", str(cm.exception))
+        )
 
     def test_can_reuse_voice_after_deletion(self):
         """Test that voice can be reused after original is soft-deleted."""
@@ -196,9 +205,9 @@ class AudioModelVoiceUniquenessTests(TestCase):
         )
 
         # Soft delete it
-        audio1.lifetime_status = AudioLifetimeStatus.DELETED
-        audio1.deleted_at = timezone.now()
-        audio1.save()
+        Audio.objects.filter(pk=audio1.pk).update(
+            lifetime_status=AudioLifetimeStatus.DELETED, deleted_at=timezone.now()
+        )
 
         # Should be able to create new audio with same voice
         audio2 = Audio(
@@ -208,8 +217,7 @@ class AudioModelVoiceUniquenessTests(TestCase):
             s3_key="audios/joanna2.mp3",
             lifetime_status=AudioLifetimeStatus.ACTIVE,
         )
-        audio2.clean()  # Should not raise
-        audio2.save()
+        audio2.save()  # Runs clean(), which should not raise
         self.assertEqual(audio2.voice, TTSVoice.JOANNA)
 
     def test_can_reuse_voice_after_expiry(self):
@@ -224,8 +232,9 @@ class AudioModelVoiceUniquenessTests(TestCase):
         )
 
         # Mark as expired
-        audio1.lifetime_status = AudioLifetimeStatus.EXPIRED
-        audio1.save()
+        Audio.objects.filter(pk=audio1.pk).update(
+            lifetime_status=AudioLifetimeStatus.EXPIRED
+        )
 
         # Should be able to create new audio with same voice
         audio2 = Audio(
@@ -235,17 +244,11 @@ class AudioModelVoiceUniquenessTests(TestCase):
             s3_key="audios/matthew2.mp3",
             lifetime_status=AudioLifetimeStatus.ACTIVE,
         )
-        audio2.clean()  # Should not raise
-        audio2.save()
+        audio2.save()  # Runs clean(), which should not raise
         self.assertEqual(audio2.voice, TTSVoice.MATTHEW)
 
     def test_different_pages_can_have_same_voice(self):
         """Test that different pages can have audios with same voice."""
-        # Create second page
-        page2 = DocumentPage.objects.create(
-            document=self.document, page_number=2, markdown_content="Different content"
-        )
-
         # Create audio on first page
         Audio.objects.create(
             page=self.page,
@@ -256,129 +259,143 @@ class AudioModelVoiceUniquenessTests(TestCase):
 
         # Create audio on second page with same voice - should succeed
         audio2 = Audio(
-            page=page2,
+            page=self.page2,
             voice=TTSVoice.IVY,
             generated_by=self.user,
             s3_key="audios/ivy_page2.mp3",
         )
-        audio2.clean()  # Should not raise
-        audio2.save()
+        audio2.save()  # Runs clean(), which should not raise
         self.assertEqual(audio2.voice, TTSVoice.IVY)
 
 
-class AudioModelExpiryTests(TestCase):
-    """Test expiry logic (is_expired, days_until_expiry, needs_expiry_warning)."""
-
-    def setUp(self):
-        """Create test data."""
-        self.user = User.objects.create_user(username="testuser23", email="test@example.com", password="testpass123"
-        )
-        self.document = Document.objects.create(
-            user=self.user, title="Test Document", source_content="test.pdf", source_type="FILE", status="COMPLETED"
-        )
-        self.page = DocumentPage.objects.create(
-            document=self.document, page_number=1, markdown_content="Test content"
-        )
-
+@tag("models", "fast")
+class AudioModelExpiryTests(BaseAudioTestMixin, TestCase):
+    """
+    Test expiry logic (is_expired, days_until_expiry, needs_expiry_warning).
+
+    The expiry methods only read SiteSettings from the database, so the audios
+    under test are built unsaved with created_at set by hand.
+    """
+
+    # timezone.now() returns this instant for the whole class, both in the
+    # model and in the tests, so expiry arithmetic can be asserted exactly
+    FROZEN_NOW = datetime(2024, 1, 1, 12, 0, tzinfo=dt_timezone.utc)
+    ONE_MONTH_AGO = FROZEN_NOW - timedelta(days=30)
+    HUNDRED_DAYS_AGO = FROZEN_NOW - timedelta(days=100)
+    FIVE_MONTHS_AGO = FROZEN_NOW - timedelta(days=150)
+    TWENTY_FIVE_DAYS_LEFT = FROZEN_NOW - timedelta(days=155)
+    SIX_AND_A_HALF_MONTHS_AGO = FROZEN_NOW - timedelta(days=200)
+    SEVEN_MONTHS_AGO = FROZEN_NOW - timedelta(days=210)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._clock_patcher = patch(
+            "django.utils.timezone.now", return_value=cls.FROZEN_NOW
+        )
+        cls._clock_patcher.start()
+        cls.addClassCleanup(cls._clock_patcher.stop)
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create test data and pin the retention period."""
+        super().setUpTestData()
         # Set retention to 6 months (180 days)
-        self.settings = SiteSettings.get_settings()
-        self.settings.audio_retention_months = 6
-        self.settings.save()
+        cls.settings = SiteSettings.get_settings()
+        cls.settings.audio_retention_months = 6
+        cls.settings.save()
 
     def test_is_expired_never_played_not_expired(self):
         """Test audio created recently (never played) is not expired."""
-        audio = Audio.objects.create(
+        audio = Audio(
             page=self.page,
             voice=TTSVoice.JOANNA,
             generated_by=self.user,
             s3_key="audios/test.mp3",
             status=AudioGenerationStatus.COMPLETED,
             last_played_at=None,  # Never played
+            created_at=self.FROZEN_NOW,
         )
-        self.assertFalse(audio.is_expired())
+        # Only the SiteSettings lookup touches the database
+        with self.assertNumQueries(1):
+            self.assertFalse(audio.is_expired())
 
     def test_is_expired_never_played_is_expired(self):
         """Test audio created 7 months ago (never played) is expired."""
-        audio = Audio.objects.create(
+        audio = Audio(
             page=self.page,
             voice=TTSVoice.JOANNA,
             generated_by=self.user,
             s3_key="audios/test.mp3",
             status=AudioGenerationStatus.COMPLETED,
             last_played_at=None,
+            created_at=self.SEVEN_MONTHS_AGO,
         )
 
-        # Manually set created_at to 7 months ago
-        audio.created_at = timezone.now() - timedelta(days=210)
-        audio.save()
-
         self.assertTrue(audio.is_expired())
 
     def test_is_expired_recently_played(self):
         """Test audio played recently is not expired."""
-        audio = Audio.objects.create(
+        audio = Audio(
             page=self.page,
             voice=TTSVoice.MATTHEW,
             generated_by=self.user,
             s3_key="audios/test.mp3",
             status=AudioGenerationStatus.COMPLETED,
-            last_played_at=timezone.now() - timedelta(days=30),  # 1 month ago
+            last_played_at=self.ONE_MONTH_AGO,
         )
         self.assertFalse(audio.is_expired())
 
     def test_is_expired_old_play_date(self):
         """Test audio not played for 7 months is expired."""
-        audio = Audio.objects.create(
+        audio = Audio(
             page=self.page,
             voice=TTSVoice.IVY,
             generated_by=self.user,
             s3_key="audios/test.mp3",
             status=AudioGenerationStatus.COMPLETED,
-            last_played_at=timezone.now() - timedelta(days=210),  # 7 months
+            last_played_at=self.SEVEN_MONTHS_AGO,
         )
         self.assertTrue(audio.is_expired())
 
     def test_days_until_expiry_never_played(self):
         """Test days_until_expiry calculation for never-played audio."""
-        audio = Audio.objects.create(
+        audio = Audio(
             page=self.page,
             voice=TTSVoice.JOEY,
             generated_by=self.user,
             s3_key="audios/test.mp3",
             status=AudioGenerationStatus.COMPLETED,
             last_played_at=None,
+            created_at=self.FROZEN_NOW,
         )
 
-        # Should be ~180 days (6 months)
-        days = audio.days_until_expiry()
-        self.assertGreater(days, 175)
-        self.assertLess(days, 181)
+        # Should be 180 days (6 months)
+        self.assertEqual(audio.days_until_expiry(), 180)
 
     def test_days_until_expiry_recently_played(self):
         """Test days_until_expiry after recent play."""
-        audio = Audio.objects.create(
+        audio = Audio(
             page=self.page,
             voice=TTSVoice.KENDRA,
             generated_by=self.user,
             s3_key="audios/test.mp3",
             status=AudioGenerationStatus.COMPLETED,
-            last_played_at=timezone.now() - timedelta(days=150),  # 5 months ago
+            last_played_at=self.FIVE_MONTHS_AGO,
         )
 
-        # Should be ~30 days left (180 - 150)
-        days = audio.days_until_expiry()
-        self.assertGreater(days, 28)
-        self.assertLess(days, 32)
+        # Should be 30 days left (180 - 150)
+        self.assertEqual(audio.days_until_expiry(), 30)
 
     def test_days_until_expiry_expired_audio(self):
         """Test days_until_expiry returns 0 for expired audio."""
-        audio = Audio.objects.create(
+        audio = Audio(
             page=self.page,
             voice=TTSVoice.KIMBERLY,
             generated_by=self.user,
             s3_key="audios/test.mp3",
             status=AudioGenerationStatus.COMPLETED,
-            last_played_at=timezone.now() - timedelta(days=200),  # 6.5 months
+            last_played_at=self.SIX_AND_A_HALF_MONTHS_AGO,
         )
 
         days = audio.days_until_expiry()
@@ -386,67 +403,64 @@ class AudioModelExpiryTests(TestCase):
 
     def test_needs_expiry_warning_no_warning_needed(self):
         """Test needs_expiry_warning returns False for recently played audio."""
-        audio = Audio.objects.create(
+        audio = Audio(
             page=self.page,
             voice=TTSVoice.SALLI,
             generated_by=self.user,
             s3_key="audios/test.mp3",
             status=AudioGenerationStatus.COMPLETED,
-            last_played_at=timezone.now() - timedelta(days=30),  # 1 month ago
+            last_played_at=self.ONE_MONTH_AGO,
         )
 
-        # 150 days left, no warning needed
-        self.assertFalse(audio.needs_expiry_warning())
+        # 150 days left, no warning needed; only SiteSettings is queried
+        with self.assertNumQueries(1):
+            self.assertFalse(audio.needs_expiry_warning())
 
     def test_needs_expiry_warning_warning_needed(self):
         """Test needs_expiry_warning returns True when 25 days left."""
-        audio = Audio.objects.create(
+        audio = Audio(
             page=self.page,
             voice=TTSVoice.JUSTIN,
             generated_by=self.user,
             s3_key="audios/test.mp3",
             status=AudioGenerationStatus.COMPLETED,
-            last_played_at=timezone.now() - timedelta(days=155),  # ~25 days left
+            last_played_at=self.TWENTY_FIVE_DAYS_LEFT,
         )
 
         self.assertTrue(audio.needs_expiry_warning())
 
     def test_needs_expiry_warning_already_expired(self):
         """Test needs_expiry_warning returns False for expired audio."""
-        audio = Audio.objects.create(
+        audio = Audio(
             page=self.page,
             voice=TTSVoice.JOANNA,
             generated_by=self.user,
             s3_key="audios/test.mp3",
             status=AudioGenerationStatus.COMPLETED,
-            last_played_at=timezone.now() - timedelta(days=200),  # Expired
+            last_played_at=self.SIX_AND_A_HALF_MONTHS_AGO,  # Expired
         )
 
         self.assertFalse(audio.needs_expiry_warning())
 
     def test_get_expiry_date_never_played(self):
         """Test get_expiry_date calculation for never-played audio."""
-        now = timezone.now()
-        audio = Audio.objects.create(
+        audio = Audio(
             page=self.page,
             voice=TTSVoice.MATTHEW,
             generated_by=self.user,
             s3_key="audios/test.mp3",
             status=AudioGenerationStatus.COMPLETED,
             last_played_at=None,
+            created_at=self.FROZEN_NOW,
         )
 
         expiry_date = audio.get_expiry_date()
-        expected_expiry = audio.created_at + timedelta(days=180)
-
-        # Should be within 1 minute of expected
-        diff = abs((expiry_date - expected_expiry).total_seconds())
-        self.assertLess(diff, 60)
+        self.assertEqual(expiry_date, self.FROZEN_NOW + timedelta(days=180))
 
     def test_get_expiry_date_with_play_date(self):
         """Test get_expiry_date uses last_played_at when available."""
-        play_date = timezone.now() - timedelta(days=100)
-        audio = Audio.objects.create(
+        play_date = self.HUNDRED_DAYS_AGO
+        audio = Audio(
             page=self.page,
             voice=TTSVoice.IVY,
             generated_by=self.user,
@@ -456,26 +470,13 @@ class AudioModelExpiryTests(TestCase):
         )
 
         expiry_date = audio.get_expiry_date()
-        expected_expiry = play_date + timedelta(days=180)
-
-        diff = abs((expiry_date - expected_expiry).total_seconds())
-        self.assertLess(diff, 60)
+        self.assertEqual(expiry_date, play_date + timedelta(days=180))
 
 
-class AudioModelSoftDeleteTests(TestCase):
+@tag("models", "fast")
+class AudioModelSoftDeleteTests(BaseAudioTestMixin, TestCase):
     """Test soft delete behavior."""
 
-    def setUp(self):
-        """Create test data."""
-        self.user = User.objects.create_user(username="testuser24", email="test@example.com", password="testpass123"
-        )
-        self.document = Document.objects.create(
-            user=self.user, title="Test Document", source_content="test.pdf", source_type="FILE", status="COMPLETED"
-        )
-        self.page = DocumentPage.objects.create(
-            document=self.document, page_number=1, markdown_content="Test content"
-        )
-
     def test_soft_delete_sets_lifetime_status(self):
         """Test soft delete changes lifetime_status to DELETED."""
         audio = Audio.objects.create(
@@ -486,15 +487,18 @@ class AudioModelSoftDeleteTests(TestCase):
             lifetime_status=AudioLifetimeStatus.ACTIVE,
         )
 
-        # Soft delete
+        # Soft delete: SiteSettings + quota count in clean(), then the UPDATE
         audio.lifetime_status = AudioLifetimeStatus.DELETED
         audio.deleted_at = timezone.now()
-        audio.save()
+        with self.assertNumQueries(3):
+            audio.save()
 
-        # Refresh from DB
-        audio.refresh_from_db()
-        self.assertEqual(audio.lifetime_status, AudioLifetimeStatus.DELETED)
-        self.assertIsNotNone(audio.deleted_at)
+        # Check the stored row without re-loading every field
+        self.assertAudioExists(
+            audio.pk,
+            lifetime_status=AudioLifetimeStatus.DELETED,
+            deleted_at__isnull=False,
+        )
 
     def test_soft_delete_record_remains_in_database(self):
         """Test soft-deleted audio still exists in database."""
@@ -508,11 +512,12 @@ class AudioModelSoftDeleteTests(TestCase):
         audio_id = audio.id
 
         # Soft delete
-        audio.lifetime_status = AudioLifetimeStatus.DELETED
-        audio.save()
+        Audio.objects.filter(pk=audio.pk).update(
+            lifetime_status=AudioLifetimeStatus.DELETED
+        )
 
         # Should still exist in database
-        self.assertTrue(Audio.objects.filter(id=audio_id).exists())
+        self.assertAudioExists(audio_id)
 
     def test_soft_delete_allows_voice_reuse(self):
         """Test that soft-deleting an audio allows voice reuse."""
@@ -523,8 +528,9 @@ class AudioModelSoftDeleteTests(TestCase):
             generated_by=self.user,
             s3_key="audios/ivy1.mp3",
         )
-        audio1.lifetime_status = AudioLifetimeStatus.DELETED
-        audio1.save()
+        Audio.objects.filter(pk=audio1.pk).update(
+            lifetime_status=AudioLifetimeStatus.DELETED
+        )
 
         # Should be able to create new audio with same voice
         audio2 = Audio(
@@ -533,6 +539,5 @@ class AudioModelSoftDeleteTests(TestCase):
             generated_by=self.user,
             s3_key="audios/ivy2.mp3",
         )
-        audio2.clean()  # Should not raise
-        audio2.save()
+        audio2.save()  # Runs clean(), which should not raise
         self.assertEqual(audio2.voice, TTSVoice.IVY)
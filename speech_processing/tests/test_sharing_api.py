@@ -1,58 +1,61 @@
 """
 Integration tests for document sharing API endpoints.
 Tests share creation, permission validation, and share management.
+
+Fixtures are class-local, so the module is safe to run with --parallel.
 """
 
 import json
 from django.test import TestCase, Client
-from django.contrib.auth import get_user_model
 from django.urls import reverse
 from document_processing.models import Document, DocumentPage
 from speech_processing.models import DocumentSharing, SharingPermission
+from speech_processing.tests.utils import create_users
 
-User = get_user_model()
+# JSON bodies reused across the share_document tests
+SHARE_AS_COLLABORATOR = json.dumps(
+    {"email": "shared@example.com", "permission": "COLLABORATOR"}
+)
+SHARE_AS_VIEW_ONLY = json.dumps({"email": "shared@example.com", "permission": "VIEW_ONLY"})
+SHARE_WITH_UNKNOWN_USER = json.dumps(
+    {"email": "nonexistent@example.com", "permission": "VIEW_ONLY"}
+)
 
 
 class ShareDocumentAPITests(TestCase):
     """Test POST /documents/<document_id>/share/ endpoint."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Create test data."""
-        self.client = Client()
-        self.owner = User.objects.create_user(
-            username="testuser6", email="owner@example.com", password="testpass123"
-        )
-        self.user_to_share = User.objects.create_user(
-            username="testuser7", email="shared@example.com", password="testpass123"
-        )
-        self.other_user = User.objects.create_user(
-            username="testuser8", email="other@example.com", password="testpass123"
+        cls.owner, cls.user_to_share, cls.other_user = create_users(
+            "owner@example.com",
+            "shared@example.com",
+            "other@example.com",
         )
 
-        self.document = Document.objects.create(
-            user=self.owner,
+        cls.document = Document.objects.create(
+            user=cls.owner,
             title="Test Doc",
             source_content="test.pdf",
             source_type="FILE",
             status="COMPLETED",
         )
+        cls.url = reverse(
+            "speech_processing:share_document",
+            kwargs={"document_id": cls.document.id},
+        )
+
+    def setUp(self):
+        self.client = Client()
 
     def test_share_document_by_owner_success(self):
         """Test owner can share document with collaborator permission."""
-        self.client.login(email="owner@example.com", password="testpass123")
+        self.client.force_login(self.owner)
 
-        url = reverse(
-            "speech_processing:share_document",
-            kwargs={"document_id": self.document.id},
-        )
         response = self.client.post(
-            url,
-            data=json.dumps(
-                {
-                    "email": "shared@example.com",
-                    "permission": "COLLABORATOR",
-                }
-            ),
+            self.url,
+            data=SHARE_AS_COLLABORATOR,
             content_type="application/json",
         )
 
@@ -69,20 +72,11 @@ class ShareDocumentAPITests(TestCase):
 
     def test_share_document_by_non_owner(self):
         """Test non-owner cannot share document."""
-        self.client.login(email="other@example.com", password="testpass123")
+        self.client.force_login(self.other_user)
 
-        url = reverse(
-            "speech_processing:share_document",
-            kwargs={"document_id": self.document.id},
-        )
         response = self.client.post(
-            url,
-            data=json.dumps(
-                {
-                    "email": "shared@example.com",
-                    "permission": "VIEW_ONLY",
-                }
-            ),
+            self.url,
+            data=SHARE_AS_VIEW_ONLY,
             content_type="application/json",
         )
 
@@ -90,9 +84,7 @@ class ShareDocumentAPITests(TestCase):
         self.assertEqual(response.status_code, 403)
         data = response.json()
         self.assertFalse(data["success"])
-        # Check for either 'permission' or 'access' in error message
-        error_lower = data["error"].lower()
-        self.assertTrue("permission" in error_lower or "access" in error_lower)
+        self.assertEqual(data["error_code"], "NO_PERMISSION")
 
     def test_share_document_with_can_share_permission(self):
         """Test user with CAN_SHARE permission can share document."""
@@ -104,20 +96,11 @@ class ShareDocumentAPITests(TestCase):
             permission=SharingPermission.CAN_SHARE,
         )
 
-        self.client.login(email="other@example.com", password="testpass123")
+        self.client.force_login(self.other_user)
 
-        url = reverse(
-            "speech_processing:share_document",
-            kwargs={"document_id": self.document.id},
-        )
         response = self.client.post(
-            url,
-            data=json.dumps(
-                {
-                    "email": "shared@example.com",
-                    "permission": "VIEW_ONLY",
-                }
-            ),
+            self.url,
+            data=SHARE_AS_VIEW_ONLY,
             content_type="application/json",
         )
 
@@ -133,20 +116,11 @@ class ShareDocumentAPITests(TestCase):
 
     def test_share_document_invalid_email(self):
         """Test sharing with non-existent email fails gracefully."""
-        self.client.login(email="owner@example.com", password="testpass123")
+        self.client.force_login(self.owner)
 
-        url = reverse(
-            "speech_processing:share_document",
-            kwargs={"document_id": self.document.id},
-        )
         response = self.client.post(
-            url,
-            data=json.dumps(
-                {
-                    "email": "nonexistent@example.com",
-                    "permission": "VIEW_ONLY",
-                }
-            ),
+            self.url,
+            data=SHARE_WITH_UNKNOWN_USER,
             content_type="application/json",
         )
 
@@ -154,7 +128,7 @@ class ShareDocumentAPITests(TestCase):
         self.assertEqual(response.status_code, 404)
         data = response.json()
         self.assertFalse(data["success"])
-        self.assertIn("user", data["error"].lower())
+        self.assertEqual(data["error_code"], "USER_NOT_FOUND")
 
     def test_share_document_duplicate_share(self):
         """Test sharing with already shared user updates the share."""
@@ -166,20 +140,11 @@ class ShareDocumentAPITests(TestCase):
             permission=SharingPermission.VIEW_ONLY,
         )
 
-        self.client.login(email="owner@example.com", password="testpass123")
+        self.client.force_login(self.owner)
 
-        url = reverse(
-            "speech_processing:share_document",
-            kwargs={"document_id": self.document.id},
-        )
         response = self.client.post(
-            url,
-            data=json.dumps(
-                {
-                    "email": "shared@example.com",
-                    "permission": "COLLABORATOR",
-                }
-            ),
+            self.url,
+            data=SHARE_AS_COLLABORATOR,
             content_type="application/json",
         )
 
@@ -201,42 +166,43 @@ class ShareDocumentAPITests(TestCase):
 class UnshareDocumentAPITests(TestCase):
     """Test DELETE /documents/<document_id>/unshare/<share_id>/ endpoint."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Create test data."""
-        self.client = Client()
-        self.owner = User.objects.create_user(
-            username="testuser9", email="owner@example.com", password="testpass123"
-        )
-        self.shared_user = User.objects.create_user(
-            username="testuser10", email="shared@example.com", password="testpass123"
-        )
-        self.other_user = User.objects.create_user(
-            username="testuser11", email="other@example.com", password="testpass123"
+        cls.owner, cls.shared_user, cls.other_user = create_users(
+            "owner@example.com",
+            "shared@example.com",
+            "other@example.com",
         )
 
-        self.document = Document.objects.create(
-            user=self.owner,
+        cls.document = Document.objects.create(
+            user=cls.owner,
             title="Test Doc",
             source_content="test.pdf",
             source_type="FILE",
             status="COMPLETED",
         )
-        self.share = DocumentSharing.objects.create(
-            document=self.document,
-            shared_with=self.shared_user,
-            shared_by=self.owner,
+        # Tests that delete or modify the share see a fresh copy each time,
+        # since TestCase rolls the row back and re-copies class attributes
+        cls.share = DocumentSharing.objects.create(
+            document=cls.document,
+            shared_with=cls.shared_user,
+            shared_by=cls.owner,
             permission=SharingPermission.COLLABORATOR,
         )
+        cls.url = reverse(
+            "speech_processing:unshare_document",
+            kwargs={"sharing_id": cls.share.id},
+        )
+
+    def setUp(self):
+        self.client = Client()
 
     def test_unshare_by_owner_success(self):
         """Test owner can remove share."""
-        self.client.login(email="owner@example.com", password="testpass123")
+        self.client.force_login(self.owner)
 
-        url = reverse(
-            "speech_processing:unshare_document",
-            kwargs={"sharing_id": self.share.id},
-        )
-        response = self.client.delete(url)
+        response = self.client.delete(self.url)
 
         self.assertEqual(response.status_code, 200)
         data = response.json()
@@ -247,18 +213,14 @@ class UnshareDocumentAPITests(TestCase):
 
     def test_unshare_by_non_owner(self):
         """Test non-owner cannot remove share."""
-        self.client.login(email="other@example.com", password="testpass123")
+        self.client.force_login(self.other_user)
 
-        url = reverse(
-            "speech_processing:unshare_document",
-            kwargs={"sharing_id": self.share.id},
-        )
-        response = self.client.delete(url)
+        response = self.client.delete(self.url)
 
         self.assertEqual(response.status_code, 403)
         data = response.json()
         self.assertFalse(data["success"])
-        self.assertIn("permission", data["error"].lower())
+        self.assertEqual(data["error_code"], "NO_PERMISSION")
 
         # Share should still exist
         self.assertTrue(DocumentSharing.objects.filter(id=self.share.id).exists())
@@ -267,21 +229,17 @@ class UnshareDocumentAPITests(TestCase):
 class DocumentSharesListAPITests(TestCase):
     """Test GET /documents/<document_id>/shares/ endpoint."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Create test data."""
-        self.client = Client()
-        self.owner = User.objects.create_user(
-            username="testuser12", email="owner@example.com", password="testpass123"
-        )
-        self.user1 = User.objects.create_user(
-            username="testuser13", email="user1@example.com", password="testpass123"
-        )
-        self.user2 = User.objects.create_user(
-            username="testuser14", email="user2@example.com", password="testpass123"
+        cls.owner, cls.user1, cls.user2 = create_users(
+            "owner@example.com",
+            "user1@example.com",
+            "user2@example.com",
         )
 
-        self.document = Document.objects.create(
-            user=self.owner,
+        cls.document = Document.objects.create(
+            user=cls.owner,
             title="Test Doc",
             source_content="test.pdf",
             source_type="FILE",
@@ -290,27 +248,32 @@ class DocumentSharesListAPITests(TestCase):
 
         # Create shares
         DocumentSharing.objects.create(
-            document=self.document,
-            shared_with=self.user1,
-            shared_by=self.owner,
+            document=cls.document,
+            shared_with=cls.user1,
+            shared_by=cls.owner,
             permission=SharingPermission.COLLABORATOR,
         )
         DocumentSharing.objects.create(
-            document=self.document,
-            shared_with=self.user2,
-            shared_by=self.owner,
+            document=cls.document,
+            shared_with=cls.user2,
+            shared_by=cls.owner,
             permission=SharingPermission.VIEW_ONLY,
         )
+        cls.url = reverse(
+            "speech_processing:document_shares",
+            kwargs={"document_id": cls.document.id},
+        )
+
+    def setUp(self):
+        self.client = Client()
 
     def test_list_shares_by_owner(self):
         """Test owner can list all shares."""
-        self.client.login(email="owner@example.com", password="testpass123")
+        self.client.force_login(self.owner)
 
-        url = reverse(
-            "speech_processing:document_shares",
-            kwargs={"document_id": self.document.id},
-        )
-        response = self.client.get(url)
+        # Session + user, document + its owner, then one joined shares query
+        with self.assertNumQueries(5):
+            response = self.client.get(self.url)
 
         self.assertEqual(response.status_code, 200)
         data = response.json()
@@ -322,58 +285,82 @@ class DocumentSharesListAPITests(TestCase):
         self.assertIn("user1@example.com", emails)
         self.assertIn("user2@example.com", emails)
 
+    def test_list_shares_query_count_does_not_grow_with_shares(self):
+        """Test listing 20 shares costs the same queries as listing 2."""
+        viewers = create_users(*(f"viewer{i}@example.com" for i in range(18)))
+        DocumentSharing.objects.bulk_create(
+            DocumentSharing(
+                document=self.document,
+                shared_with=viewer,
+                shared_by=self.owner,
+                permission=SharingPermission.VIEW_ONLY,
+            )
+            for viewer in viewers
+        )
+        self.client.force_login(self.owner)
+
+        with self.assertNumQueries(5):
+            response = self.client.get(self.url)
+
+        self.assertEqual(len(response.json()["shares"]), 20)
+
 
 class SharedWithMeAPITests(TestCase):
     """Test GET /documents/shared-with-me/ endpoint."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Create test data."""
-        self.client = Client()
-        self.owner1 = User.objects.create_user(
-            username="testuser15", email="owner1@example.com", password="testpass123"
-        )
-        self.owner2 = User.objects.create_user(
-            username="testuser16", email="owner2@example.com", password="testpass123"
-        )
-        self.shared_user = User.objects.create_user(
-            username="testuser17", email="shared@example.com", password="testpass123"
-        )
-
-        self.doc1 = Document.objects.create(
-            user=self.owner1,
-            title="Doc 1",
-            source_content="doc1.pdf",
-            source_type="FILE",
-            status="COMPLETED",
-        )
-        self.doc2 = Document.objects.create(
-            user=self.owner2,
-            title="Doc 2",
-            source_content="doc2.pdf",
-            source_type="FILE",
-            status="COMPLETED",
+        cls.owner1, cls.owner2, cls.shared_user = create_users(
+            "owner1@example.com",
+            "owner2@example.com",
+            "shared@example.com",
+        )
+
+        cls.doc1, cls.doc2 = Document.objects.bulk_create(
+            [
+                Document(
+                    user=cls.owner1,
+                    title="Doc 1",
+                    source_content="doc1.pdf",
+                    source_type="FILE",
+                    status="COMPLETED",
+                ),
+                Document(
+                    user=cls.owner2,
+                    title="Doc 2",
+                    source_content="doc2.pdf",
+                    source_type="FILE",
+                    status="COMPLETED",
+                ),
+            ]
         )
 
         # Share both documents with shared_user
         DocumentSharing.objects.create(
-            document=self.doc1,
-            shared_with=self.shared_user,
-            shared_by=self.owner1,
+            document=cls.doc1,
+            shared_with=cls.shared_user,
+            shared_by=cls.owner1,
             permission=SharingPermission.COLLABORATOR,
         )
         DocumentSharing.objects.create(
-            document=self.doc2,
-            shared_with=self.shared_user,
-            shared_by=self.owner2,
+            document=cls.doc2,
+            shared_with=cls.shared_user,
+            shared_by=cls.owner2,
             permission=SharingPermission.VIEW_ONLY,
         )
+        cls.url = reverse("speech_processing:shared_with_me")
+
+    def setUp(self):
+        self.client = Client()
 
     def test_list_shared_with_me(self):
         """Test user can list documents shared with them."""
-        self.client.login(email="shared@example.com", password="testpass123")
+        self.client.force_login(self.shared_user)
 
-        url = reverse("speech_processing:shared_with_me")
-        response = self.client.get(url)
+        # Session + user, then one shares query joined to documents and owners
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
 
         self.assertEqual(response.status_code, 200)
         data = response.json()
@@ -392,47 +379,76 @@ class SharedWithMeAPITests(TestCase):
         self.assertEqual(perms["Doc 1"], "COLLABORATOR")
         self.assertEqual(perms["Doc 2"], "VIEW_ONLY")
 
+    def test_list_shared_with_me_query_count_does_not_grow_with_shares(self):
+        """Test listing 20 shared documents costs the same queries as listing 2."""
+        documents = Document.objects.bulk_create(
+            Document(
+                user=self.owner1,
+                title=f"Extra Doc {i}",
+                source_content=f"extra{i}.pdf",
+                source_type="FILE",
+                status="COMPLETED",
+            )
+            for i in range(18)
+        )
+        DocumentSharing.objects.bulk_create(
+            DocumentSharing(
+                document=document,
+                shared_with=self.shared_user,
+                shared_by=self.owner1,
+                permission=SharingPermission.VIEW_ONLY,
+            )
+            for document in documents
+        )
+        self.client.force_login(self.shared_user)
+
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+
+        self.assertEqual(len(response.json()["documents"]), 20)
+
 
 class UpdateSharePermissionAPITests(TestCase):
     """Test PATCH /documents/<document_id>/shares/<share_id>/permission/ endpoint."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Create test data."""
-        self.client = Client()
-        self.owner = User.objects.create_user(
-            username="testuser18", email="owner@example.com", password="testpass123"
-        )
-        self.shared_user = User.objects.create_user(
-            username="testuser19", email="shared@example.com", password="testpass123"
-        )
-        self.other_user = User.objects.create_user(
-            username="testuser20", email="other@example.com", password="testpass123"
+        cls.owner, cls.shared_user, cls.other_user = create_users(
+            "owner@example.com",
+            "shared@example.com",
+            "other@example.com",
         )
 
-        self.document = Document.objects.create(
-            user=self.owner,
+        cls.document = Document.objects.create(
+            user=cls.owner,
             title="Test Doc",
             source_content="test.pdf",
             source_type="FILE",
             status="COMPLETED",
         )
-        self.share = DocumentSharing.objects.create(
-            document=self.document,
-            shared_with=self.shared_user,
-            shared_by=self.owner,
+        # Tests that delete or modify the share see a fresh copy each time,
+        # since TestCase rolls the row back and re-copies class attributes
+        cls.share = DocumentSharing.objects.create(
+            document=cls.document,
+            shared_with=cls.shared_user,
+            shared_by=cls.owner,
             permission=SharingPermission.VIEW_ONLY,
         )
+        cls.url = reverse(
+            "speech_processing:update_share_permission",
+            kwargs={"sharing_id": cls.share.id},
+        )
+
+    def setUp(self):
+        self.client = Client()
 
     def test_update_permission_by_owner(self):
         """Test owner can update share permission."""
-        self.client.login(email="owner@example.com", password="testpass123")
+        self.client.force_login(self.owner)
 
-        url = reverse(
-            "speech_processing:update_share_permission",
-            kwargs={"sharing_id": self.share.id},
-        )
         response = self.client.patch(
-            url,
+            self.url,
             data=json.dumps({"permission": "COLLABORATOR"}),
             content_type="application/json",
         )
@@ -447,14 +463,10 @@ class UpdateSharePermissionAPITests(TestCase):
 
     def test_update_permission_by_non_owner(self):
         """Test non-owner cannot update permission."""
-        self.client.login(email="other@example.com", password="testpass123")
+        self.client.force_login(self.other_user)
 
-        url = reverse(
-            "speech_processing:update_share_permission",
-            kwargs={"sharing_id": self.share.id},
-        )
         response = self.client.patch(
-            url,
+            self.url,
             data=json.dumps({"permission": "CAN_SHARE"}),
             content_type="application/json",
         )
@@ -462,7 +474,7 @@ class UpdateSharePermissionAPITests(TestCase):
         self.assertEqual(response.status_code, 403)
         data = response.json()
         self.assertFalse(data["success"])
-        self.assertIn("permission", data["error"].lower())
+        self.assertEqual(data["error_code"], "NO_PERMISSION")
 
         # Permission should not change
         self.share.refresh_from_db()
@@ -470,14 +482,10 @@ class UpdateSharePermissionAPITests(TestCase):
 
     def test_update_permission_invalid_value(self):
         """Test update fails with invalid permission value."""
-        self.client.login(email="owner@example.com", password="testpass123")
+        self.client.force_login(self.owner)
 
-        url = reverse(
-            "speech_processing:update_share_permission",
-            kwargs={"sharing_id": self.share.id},
-        )
         response = self.client.patch(
-            url,
+            self.url,
             data=json.dumps({"permission": "INVALID"}),
             content_type="application/json",
         )
@@ -485,4 +493,4 @@ class UpdateSharePermissionAPITests(TestCase):
         self.assertEqual(response.status_code, 400)
         data = response.json()
         self.assertFalse(data["success"])
-        self.assertIn("invalid", data["error"].lower())
+        self.assertEqual(data["error_code"], "INVALID_PERMISSION")
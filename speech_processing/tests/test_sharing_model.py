@@ -1,33 +1,38 @@
 """
 Unit tests for DocumentSharing and SiteSettings models.
+
+Fixtures are class-local, so the module is safe to run with --parallel.
 """
 
-from django.test import TestCase
-from django.contrib.auth import get_user_model
-from django.db import IntegrityError
+from django.core.exceptions import ValidationError
+from django.test import TestCase, override_settings
+from django.db import IntegrityError, transaction
 from document_processing.models import Document
 from speech_processing.models import (
     DocumentSharing,
     SharingPermission,
     SiteSettings,
 )
-
-User = get_user_model()
+from speech_processing.tests.utils import SiteSettingsCacheMixin, create_users
 
 
 class DocumentSharingModelTests(TestCase):
     """Test DocumentSharing model permissions and constraints."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Create test users and document."""
-        self.owner = User.objects.create_user(username="testuser1", email="owner@example.com", password="testpass123"
-        )
-        self.collaborator = User.objects.create_user(username="testuser2", email="collaborator@example.com", password="testpass123"
+        cls.owner, cls.collaborator, cls.viewer = create_users(
+            "owner@example.com",
+            "collaborator@example.com",
+            "viewer@example.com",
         )
-        self.viewer = User.objects.create_user(username="testuser3", email="viewer@example.com", password="testpass123"
-        )
-        self.document = Document.objects.create(
-            user=self.owner, title="Test Document", source_content="test.pdf", source_type="FILE", status="COMPLETED"
+        cls.document = Document.objects.create(
+            user=cls.owner,
+            title="Test Document",
+            source_content="test.pdf",
+            source_type="FILE",
+            status="COMPLETED",
         )
 
     def test_can_generate_audio_with_collaborator_permission(self):
@@ -100,20 +105,26 @@ class DocumentSharingModelTests(TestCase):
             permission=SharingPermission.VIEW_ONLY,
         )
 
-        # Try to create duplicate - should fail
+        # Try to create duplicate - should fail. The savepoint keeps the
+        # test transaction usable afterwards (PostgreSQL aborts it otherwise)
         with self.assertRaises(IntegrityError):
-            DocumentSharing.objects.create(
-                document=self.document,
-                shared_with=self.collaborator,  # Same user
-                shared_by=self.owner,
-                permission=SharingPermission.COLLABORATOR,
-            )
+            with transaction.atomic():
+                DocumentSharing.objects.create(
+                    document=self.document,
+                    shared_with=self.collaborator,  # Same user
+                    shared_by=self.owner,
+                    permission=SharingPermission.COLLABORATOR,
+                )
+
+        # The original share is untouched
+        share = DocumentSharing.objects.get(document=self.document)
+        self.assertEqual(share.permission, SharingPermission.VIEW_ONLY)
 
     def test_can_share_same_document_with_different_users(self):
         """Test document can be shared with multiple users."""
-        user2 = User.objects.create_user(username="testuser4", email="user2@example.com", password="testpass123"
-        )
-        user3 = User.objects.create_user(username="testuser5", email="user3@example.com", password="testpass123"
+        user2, user3 = create_users(
+            "user2@example.com",
+            "user3@example.com",
         )
 
         # Share with first user
@@ -146,8 +157,23 @@ class DocumentSharingModelTests(TestCase):
             permission=SharingPermission.VIEW_ONLY,
         )
 
-        doc2 = Document.objects.create(
-            user=self.owner, title="Doc 2", source_content="test2.pdf", source_type="FILE", status="COMPLETED"
+        doc2, doc3 = Document.objects.bulk_create(
+            [
+                Document(
+                    user=self.owner,
+                    title="Doc 2",
+                    source_content="test2.pdf",
+                    source_type="FILE",
+                    status="COMPLETED",
+                ),
+                Document(
+                    user=self.owner,
+                    title="Doc 3",
+                    source_content="test3.pdf",
+                    source_type="FILE",
+                    status="COMPLETED",
+                ),
+            ]
         )
         collaborator_share = DocumentSharing.objects.create(
             document=doc2,
@@ -156,9 +182,6 @@ class DocumentSharingModelTests(TestCase):
             permission=SharingPermission.COLLABORATOR,
         )
 
-        doc3 = Document.objects.create(
-            user=self.owner, title="Doc 3", source_content="test3.pdf", source_type="FILE", status="COMPLETED"
-        )
         can_share_share = DocumentSharing.objects.create(
             document=doc3,
             shared_with=self.collaborator,
@@ -179,13 +202,9 @@ class DocumentSharingModelTests(TestCase):
         self.assertTrue(can_share_share.can_share())
 
 
-class SiteSettingsModelTests(TestCase):
+class SiteSettingsModelTests(SiteSettingsCacheMixin, TestCase):
     """Test SiteSettings singleton pattern."""
 
-    def tearDown(self):
-        """Clean up all SiteSettings instances after each test."""
-        SiteSettings.objects.all().delete()
-
     def test_get_settings_creates_instance_if_none_exists(self):
         """Test get_settings creates instance with defaults if none exists."""
         # Ensure no settings exist
@@ -193,9 +212,14 @@ class SiteSettingsModelTests(TestCase):
 
         settings = SiteSettings.get_settings()
         self.assertIsNotNone(settings)
-        self.assertEqual(settings.max_audios_per_page, 4)
-        self.assertEqual(settings.audio_retention_months, 6)
-        self.assertTrue(settings.audio_generation_enabled)
+
+        with self.subTest("defaults"):
+            self.assertEqual(settings.max_audios_per_page, 4)
+            self.assertEqual(settings.audio_retention_months, 6)
+            self.assertEqual(settings.expiry_warning_days, 30)
+            self.assertTrue(settings.audio_generation_enabled)
+            self.assertTrue(settings.enable_email_notifications)
+            self.assertTrue(settings.enable_in_app_notifications)
 
     def test_get_settings_returns_existing_instance(self):
         """Test get_settings returns existing instance if one exists."""
@@ -221,23 +245,12 @@ class SiteSettingsModelTests(TestCase):
         # Try to create second instance - should raise validation error
         settings2 = SiteSettings(max_audios_per_page=5)
 
-        with self.assertRaises(Exception):  # Will raise in save()
+        with self.assertRaises(ValidationError):
             settings2.save()
 
         # Only one instance should exist
         self.assertEqual(SiteSettings.objects.count(), 1)
 
-    def test_default_values(self):
-        """Test that default values are set correctly."""
-        settings = SiteSettings.get_settings()
-
-        self.assertEqual(settings.max_audios_per_page, 4)
-        self.assertEqual(settings.audio_retention_months, 6)
-        self.assertEqual(settings.expiry_warning_days, 30)
-        self.assertTrue(settings.audio_generation_enabled)
-        self.assertTrue(settings.enable_email_notifications)
-        self.assertTrue(settings.enable_in_app_notifications)
-
     def test_can_update_existing_settings(self):
         """Test that existing settings can be updated."""
         settings = SiteSettings.get_settings()
@@ -254,6 +267,25 @@ class SiteSettingsModelTests(TestCase):
         self.assertEqual(settings.max_audios_per_page, 10)
         self.assertEqual(settings.audio_retention_months, 12)
 
+    @override_settings(SITE_SETTINGS_CACHE_SECONDS=60)
+    def test_get_settings_is_cached_until_saved(self):
+        """Test get_settings serves a cached copy until the row is saved."""
+
+        first_call = SiteSettings.get_settings()
+        with self.assertNumQueries(0):
+            cached = SiteSettings.get_settings()
+        self.assertEqual(cached.pk, first_call.pk)
+
+        # Callers get their own copy, so local edits don't reach the cache
+        cached.max_audios_per_page = 99
+        self.assertEqual(SiteSettings.get_settings().max_audios_per_page, 4)
+
+        # Saving clears the cache, so the next call sees the new value
+        first_call.max_audios_per_page = 7
+        first_call.save()
+        with self.assertNumQueries(1):
+            self.assertEqual(SiteSettings.get_settings().max_audios_per_page, 7)
+
     def test_settings_str_representation(self):
         """Test string representation of settings."""
         settings = SiteSettings.get_settings()
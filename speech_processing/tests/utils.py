@@ -0,0 +1,65 @@
+"""
+Shared fixtures for the speech_processing test modules.
+"""
+
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from document_processing.models import Document, DocumentPage
+
+User = get_user_model()
+
+
+class SiteSettingsCacheMixin:
+    """
+    Run every test with the in-process SiteSettings cache switched off.
+
+    TestCase rollbacks don't send post_save/post_delete, so a row cached by
+    one test would otherwise be served to the next, and the pinned query
+    counts assume each get_settings() call reads the database. Overriding
+    the setting also empties the cache on the way in and out.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.enterContext(override_settings(SITE_SETTINGS_CACHE_SECONDS=0))
+
+
+def create_users(*emails):
+    """Insert accounts for the given emails in a single query.
+
+    Usernames are the local part of each email; they only need to be unique
+    within a test, since every TestCase runs in its own rolled-back transaction.
+    """
+    users = [User(username=email.split("@")[0], email=email) for email in emails]
+    for user in users:
+        user.set_password("testpass123")
+    return User.objects.bulk_create(users)
+
+
+class DocumentFixtureMixin(SiteSettingsCacheMixin):
+    """
+    Create the document owner, a document and its first page once per class.
+
+    Subclasses extend setUpTestData (calling super() first) to add their own
+    users and Audio rows.
+    """
+
+    page_content = "Test content"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(
+            username="owner", email="owner@example.com", password="testpass123"
+        )
+        cls.document = Document.objects.create(
+            user=cls.owner,
+            title="Test Doc",
+            source_content="test.pdf",
+            source_type="FILE",
+            status="COMPLETED",
+        )
+        cls.page = DocumentPage.objects.create(
+            document=cls.document,
+            page_number=1,
+            markdown_content=cls.page_content,
+        )
@@ -19,6 +19,7 @@ from speech_processing.models import (
 )
 from speech_processing.services import AudioGenerationService, AudioGenerationError
 from speech_processing.tasks import generate_audio_task, check_audio_generation_status
+from speech_processing.permissions import user_can_access_document
 from speech_processing.logging_utils import (
     audit_log,
     log_generation_start,
@@ -35,6 +36,16 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _get_audio_or_404(audio_id):
+    """
+    Fetch an audio together with the page, document and creator the audio
+    endpoints read, so access checks and responses need no further queries.
+    """
+    return get_object_or_404(
+        Audio.objects.select_related("page__document", "generated_by"), id=audio_id
+    )
+
+
 @require_http_methods(["POST"])
 @login_required
 def generate_audio(request, page_id):
@@ -133,18 +144,13 @@ def audio_status(request, audio_id):
     GET /speech/audio/<audio_id>/status/
     """
     try:
-        audio = get_object_or_404(Audio, id=audio_id)
+        audio = _get_audio_or_404(audio_id)
 
         # Check if user has access to this audio
         page = audio.page
         document = page.document
 
-        has_access = (
-            document.user == request.user
-            or DocumentSharing.objects.filter(
-                document=document, shared_with=request.user
-            ).exists()
-        )
+        has_access = user_can_access_document(request.user, document)
 
         if not has_access:
             return JsonResponse(
@@ -185,18 +191,13 @@ def download_audio(request, audio_id):
     GET /speech/audio/<audio_id>/download/
     """
     try:
-        audio = get_object_or_404(Audio, id=audio_id)
+        audio = _get_audio_or_404(audio_id)
 
         # Check if user has access
         page = audio.page
         document = page.document
 
-        has_access = (
-            document.user == request.user
-            or DocumentSharing.objects.filter(
-                document=document, shared_with=request.user
-            ).exists()
-        )
+        has_access = user_can_access_document(request.user, document)
 
         if not has_access:
             return JsonResponse(
@@ -222,11 +223,12 @@ def download_audio(request, audio_id):
                 status=500,
             )
 
-        # Update last_played_at (since download implies playing)
+        # Update last_played_at (since download implies playing). A direct
+        # UPDATE skips save()'s quota and voice checks, which only matter
+        # when an audio is created
         from django.utils import timezone
 
-        audio.last_played_at = timezone.now()
-        audio.save()
+        Audio.objects.filter(pk=audio.pk).update(last_played_at=timezone.now())
 
         return JsonResponse(
             {
@@ -256,18 +258,13 @@ def play_audio(request, audio_id):
     POST /speech/audio/<audio_id>/play/
     """
     try:
-        audio = get_object_or_404(Audio, id=audio_id)
+        audio = _get_audio_or_404(audio_id)
 
         # Check if user has access
         page = audio.page
         document = page.document
 
-        has_access = (
-            document.user == request.user
-            or DocumentSharing.objects.filter(
-                document=document, shared_with=request.user
-            ).exists()
-        )
+        has_access = user_can_access_document(request.user, document)
 
         if not has_access:
             return JsonResponse(
@@ -275,11 +272,10 @@ def play_audio(request, audio_id):
                 status=403,
             )
 
-        # Update last_played_at
+        # Update last_played_at with a single UPDATE, as in download_audio
         from django.utils import timezone
 
-        audio.last_played_at = timezone.now()
-        audio.save()
+        Audio.objects.filter(pk=audio.pk).update(last_played_at=timezone.now())
 
         return JsonResponse({"success": True, "message": "Play timestamp updated"})
 
@@ -303,12 +299,12 @@ def delete_audio(request, audio_id):
     DELETE /speech/audio/<audio_id>/delete/ or POST with _method=DELETE
     """
     try:
-        audio = get_object_or_404(Audio, id=audio_id)
+        audio = _get_audio_or_404(audio_id)
 
         # Check if user is the document owner
         document = audio.page.document
 
-        if document.user != request.user:
+        if document.user_id != request.user.id:
             return JsonResponse(
                 {
                     "success": False,
@@ -321,9 +317,9 @@ def delete_audio(request, audio_id):
         from django.utils import timezone
         from speech_processing.models import AudioLifetimeStatus
 
-        audio.lifetime_status = AudioLifetimeStatus.DELETED
-        audio.deleted_at = timezone.now()
-        audio.save()
+        Audio.objects.filter(pk=audio.pk).update(
+            lifetime_status=AudioLifetimeStatus.DELETED, deleted_at=timezone.now()
+        )
 
         return JsonResponse({"success": True, "message": "Audio deleted successfully"})
 
@@ -345,16 +341,13 @@ def page_audios(request, page_id):
     GET /speech/page/<page_id>/audios/
     """
     try:
-        page = get_object_or_404(DocumentPage, id=page_id)
+        page = get_object_or_404(
+            DocumentPage.objects.select_related("document"), id=page_id
+        )
         document = page.document
 
         # Check if user has access
-        has_access = (
-            document.user == request.user
-            or DocumentSharing.objects.filter(
-                document=document, shared_with=request.user
-            ).exists()
-        )
+        has_access = user_can_access_document(request.user, document)
 
         if not has_access:
             return JsonResponse(
@@ -365,9 +358,13 @@ def page_audios(request, page_id):
         # Get active audios
         from speech_processing.models import AudioLifetimeStatus
 
-        audios = Audio.objects.filter(
-            page=page, lifetime_status=AudioLifetimeStatus.ACTIVE
-        ).select_related("generated_by")
+        # Fetched once; the voices, quota and payload are all built from
+        # this list instead of re-querying
+        audios = list(
+            Audio.objects.filter(
+                page=page, lifetime_status=AudioLifetimeStatus.ACTIVE
+            ).select_related("generated_by")
+        )
 
         # Get site settings for quota
         settings_obj = SiteSettings.get_settings()
@@ -375,7 +372,7 @@ def page_audios(request, page_id):
         service = AudioGenerationService()
 
         # Calculate available voices
-        used_voices = list(audios.values_list("voice", flat=True))
+        used_voices = [audio.voice for audio in audios]
         from speech_processing.models import TTSVoice
 
         all_voices = [v.value for v in TTSVoice]
@@ -401,7 +398,7 @@ def page_audios(request, page_id):
                         if audio.status == "COMPLETED"
                         else None
                     ),
-                    "days_until_expiry": audio.days_until_expiry(),
+                    "days_until_expiry": audio.days_until_expiry(settings_obj),
                     "error_message": audio.error_message,
                 }
             )
@@ -411,12 +408,12 @@ def page_audios(request, page_id):
                 "success": True,
                 "audios": audios_data,
                 "quota": {
-                    "used": audios.count(),
+                    "used": len(audios),
                     "max": settings_obj.max_audios_per_page,
-                    "available": settings_obj.max_audios_per_page - audios.count(),
+                    "available": settings_obj.max_audios_per_page - len(audios),
                 },
                 "voices": {"used": used_voices, "available": available_voices},
-                "is_owner": document.user == request.user,
+                "is_owner": document.user_id == request.user.id,
                 "preferred_voice": request.user.preferred_voice_id or "",
             }
         )
@@ -478,6 +475,7 @@ def share_document(request, document_id):
                         {
                             "success": False,
                             "error": "You don't have permission to share this document",
+                            "error_code": "NO_PERMISSION",
                         },
                         status=403,
                     )
@@ -486,6 +484,7 @@ def share_document(request, document_id):
                     {
                         "success": False,
                         "error": "You don't have access to this document",
+                        "error_code": "NO_PERMISSION",
                     },
                     status=403,
                 )
@@ -495,7 +494,11 @@ def share_document(request, document_id):
             user_to_share = User.objects.get(email=email)
         except User.DoesNotExist:
             return JsonResponse(
-                {"success": False, "error": f"User with email '{email}' not found"},
+                {
+                    "success": False,
+                    "error": f"User with email '{email}' not found",
+                    "error_code": "USER_NOT_FOUND",
+                },
                 status=404,
             )
         except Exception as e:
@@ -522,6 +525,7 @@ def share_document(request, document_id):
                 {
                     "success": False,
                     "error": f"Invalid permission. Must be one of: {', '.join(valid_permissions)}",
+                    "error_code": "INVALID_PERMISSION",
                 },
                 status=400,
             )
@@ -584,6 +588,7 @@ def unshare_document(request, sharing_id):
                 {
                     "success": False,
                     "error": "You don't have permission to remove this share",
+                    "error_code": "NO_PERMISSION",
                 },
                 status=403,
             )
@@ -644,6 +649,7 @@ def document_shares(request, document_id):
                         {
                             "success": False,
                             "error": "You don't have permission to view shares",
+                            "error_code": "NO_PERMISSION",
                         },
                         status=403,
                     )
@@ -652,6 +658,7 @@ def document_shares(request, document_id):
                     {
                         "success": False,
                         "error": "You don't have access to this document",
+                        "error_code": "NO_PERMISSION",
                     },
                     status=403,
                 )
@@ -800,6 +807,7 @@ def update_share_permission(request, sharing_id):
                 {
                     "success": False,
                     "error": "You don't have permission to modify this share",
+                    "error_code": "NO_PERMISSION",
                 },
                 status=403,
             )
@@ -811,6 +819,7 @@ def update_share_permission(request, sharing_id):
                 {
                     "success": False,
                     "error": f"Invalid permission. Must be one of: {', '.join(valid_permissions)}",
+                    "error_code": "INVALID_PERMISSION",
                 },
                 status=400,
             )
@@ -887,18 +896,13 @@ def retry_audio(request, audio_id):
         )
 
     try:
-        audio = get_object_or_404(Audio, id=audio_id)
+        audio = _get_audio_or_404(audio_id)
 
         # Check if user has access to this audio (owner or shared access)
         page = audio.page
         document = page.document
 
-        has_access = (
-            document.user == request.user
-            or DocumentSharing.objects.filter(
-                document=document, shared_with=request.user
-            ).exists()
-        )
+        has_access = user_can_access_document(request.user, document)
 
         if not has_access:
             return JsonResponse(